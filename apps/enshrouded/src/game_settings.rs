@@ -6,7 +6,7 @@ use serde::{Deserialize, Serialize};
 use std::path::Path;
 
 /// Represents game settings in the server configuration.
-#[derive(Serialize, Deserialize, Debug, Clone)]
+#[derive(Serialize, Deserialize, Debug, Clone, PartialEq)]
 #[serde(rename_all = "camelCase", default)]
 #[allow(clippy::struct_excessive_bools)]
 pub struct GameSettings {
@@ -124,17 +124,20 @@ impl Default for GameSettings {
 macro_rules! env_field_mapping {
     ($($field:ident => $env_var:literal),*) => {
         pub fn from_env() -> Self {
-            Self {
-                $(
-                    $field: env_parse!($env_var, Self::default().$field, _),
-                )*
-            }
+            let mut settings = Self::default();
+            settings.merge_env();
+            settings
         }
 
-        pub fn merge_env(&mut self, env_config: &GameSettings) {
+        /// Overrides every field whose environment variable is set. A value that
+        /// fails to parse resets the field to its default.
+        pub fn merge_env(&mut self) {
+            // One set of defaults serves every field, rather than building a full
+            // `GameSettings` per field and then copying the results over.
+            let defaults = Self::default();
             $(
                 if std::env::var($env_var).is_ok() {
-                    self.$field = env_config.$field.clone();
+                    self.$field = env_parse!($env_var, defaults.$field, _);
                 }
             )*
         }
@@ -190,7 +193,7 @@ impl GameSettings {
 /// - `can_edit_base`: Whether users can edit the base.
 /// - `can_extend_base`: Whether users can extend the base.
 /// - `reserved_slots`: Number of reserved slots for this group.
-#[derive(Serialize, Deserialize, Debug, Clone)]
+#[derive(Serialize, Deserialize, Debug, Clone, PartialEq)]
 #[serde(rename_all = "camelCase", default)]
 #[allow(clippy::struct_excessive_bools)]
 pub struct UserGroup {
@@ -227,7 +230,7 @@ impl Default for UserGroup {
 }
 
 /// Represents the full server configuration, including server info, game settings, and user groups.
-#[derive(Serialize, Deserialize, Debug, Clone)]
+#[derive(Serialize, Deserialize, Debug, Clone, PartialEq)]
 #[serde(rename_all = "camelCase", default)]
 pub struct ServerConfig {
     pub name: String,
@@ -289,26 +292,24 @@ pub fn load_or_create_config(path: &Path) -> ServerConfig {
     tracing::debug!("Config loaded, applying environment overrides");
     apply_env_overrides(&mut config);
 
-    let config_changed = match (
-        serde_json::to_string(&config),
-        serde_json::to_string(&original_config),
-    ) {
-        (Ok(updated), Ok(original)) => updated != original,
-        (Err(err), _) | (_, Err(err)) => {
-            tracing::warn!("Unable to serialize config for change detection: {err}");
-            true
-        }
-    };
+    // Compare the structs directly; serializing both sides just to diff them
+    // would render the whole config twice more before it is finally saved.
+    let config_changed = config != original_config;
     tracing::debug!("Config changed after env overrides: {}", config_changed);
 
     if path.exists() && config_changed {
         let timestamp = chrono::Local::now().format("%Y-%m-%d-%H.%M.%S");
         let backup_path = path.with_extension(format!("bak.{timestamp}.json"));
         tracing::debug!("Creating backup at: {:?}", backup_path);
+        // A copy rather than a hard link: the backup gets its own inode and a fresh
+        // modification time, which the pruning below ranks backups by.
         let _ = std::fs::copy(path, &backup_path);
 
         if let Some(parent) = path.parent() {
             let prefix = path.file_stem().unwrap_or_default().to_string_lossy();
+            let backup_prefix = format!("{prefix}.bak.");
+            // Each backup's modification time is read once up front instead of on
+            // every comparison.
             let mut backups: Vec<_> = std::fs::read_dir(parent)
                 .or_else(|_| std::fs::read_dir("."))
                 .map_or_else(
@@ -317,25 +318,29 @@ pub fn load_or_create_config(path: &Path) -> ServerConfig {
                         entries
                             .filter_map(std::result::Result::ok)
                             .filter(|entry| {
-                                entry
-                                    .file_name()
-                                    .to_string_lossy()
-                                    .starts_with(&format!("{prefix}.bak."))
-                                    && entry.file_name().to_string_lossy().ends_with(".json")
+                                let file_name = entry.file_name();
+                                let file_name = file_name.to_string_lossy();
+                                file_name.starts_with(&backup_prefix)
+                                    && file_name.ends_with(".json")
+                            })
+                            .map(|entry| {
+                                let modified = entry
+                                    .metadata()
+                                    .and_then(|m| m.modified())
+                                    .unwrap_or(std::time::UNIX_EPOCH);
+                                (modified, entry.path())
                             })
                             .collect()
                     },
                 );
 
             if backups.len() > 5 {
-                backups.sort_by_key(|entry| {
-                    entry
-                        .metadata()
-                        .and_then(|m| m.modified())
-                        .unwrap_or(std::time::UNIX_EPOCH)
-                });
-                for old_backup in backups.iter().take(backups.len() - 5) {
-                    let _ = std::fs::remove_file(old_backup.path());
+                // Only the split between the oldest backups and the newest five
+                // matters, so partition around it rather than sorting everything.
+                let excess = backups.len() - 5;
+                backups.select_nth_unstable_by_key(excess, |(modified, _)| *modified);
+                for (_, old_backup) in backups.iter().take(excess) {
+                    let _ = std::fs::remove_file(old_backup);
                 }
             }
         }
@@ -426,6 +431,31 @@ mod tests {
         assert_eq!(settings.tombstone_mode, "Nothing");
     }
 
+    #[test]
+    fn test_merge_env_only_overrides_set_variables() {
+        let _lock = TEST_MUTEX
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner);
+        clear_env_vars();
+        unsafe {
+            env::set_var("PLAYER_HEALTH_FACTOR", "2.5");
+            env::set_var("THREAT_BONUS", "not-a-number");
+        }
+
+        let mut settings = GameSettings {
+            player_mana_factor: 3.0,
+            threat_bonus: 7.0,
+            ..GameSettings::default()
+        };
+        settings.merge_env();
+
+        assert_eq!(settings.player_health_factor, 2.5);
+        assert_eq!(settings.player_mana_factor, 3.0);
+        // A set but unparsable value falls back to the default.
+        assert_eq!(settings.threat_bonus, 1.0);
+        clear_env_vars();
+    }
+
     #[test]
     fn test_new_config_creation_with_env() {
         use tempfile::TempDir;
@@ -489,6 +519,145 @@ mod tests {
         assert_eq!(file_port, 54321);
     }
 
+    #[test]
+    fn test_save_config_skips_identical_contents() {
+        use std::time::{Duration, UNIX_EPOCH};
+        use tempfile::TempDir;
+
+        let tmp_dir = TempDir::new().expect("create temp dir");
+        let config_path = tmp_dir.path().join("config.json");
+        save_config(&config_path, &ServerConfig::default());
+        let stale = UNIX_EPOCH + Duration::from_secs(1_000);
+        fs::File::options()
+            .write(true)
+            .open(&config_path)
+            .unwrap()
+            .set_modified(stale)
+            .unwrap();
+
+        save_config(&config_path, &ServerConfig::default());
+        let modified = fs::metadata(&config_path).unwrap().modified().unwrap();
+        assert_eq!(modified, stale);
+
+        let changed = ServerConfig {
+            name: "Changed".to_owned(),
+            ..Default::default()
+        };
+        save_config(&config_path, &changed);
+        let modified = fs::metadata(&config_path).unwrap().modified().unwrap();
+        assert_ne!(modified, stale);
+    }
+
+    #[test]
+    fn test_load_or_create_config_keeps_five_newest_backups() {
+        use std::time::{Duration, UNIX_EPOCH};
+        use tempfile::TempDir;
+
+        let _lock = TEST_MUTEX
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner);
+        clear_env_vars();
+
+        let tmp_dir = TempDir::new().expect("create temp dir");
+        let config_path = tmp_dir.path().join("config.json");
+        save_config(&config_path, &ServerConfig::default());
+
+        for i in 0..6 {
+            let backup = tmp_dir.path().join(format!("config.bak.old{i}.json"));
+            let file = fs::File::create(&backup).unwrap();
+            file.set_modified(UNIX_EPOCH + Duration::from_secs(1_000 + i))
+                .unwrap();
+        }
+
+        unsafe {
+            env::set_var("THREAT_BONUS", "5.0");
+        }
+        load_or_create_config(&config_path);
+        clear_env_vars();
+
+        let backups: Vec<String> = fs::read_dir(tmp_dir.path())
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name().to_string_lossy().into_owned())
+            .filter(|name| name.starts_with("config.bak."))
+            .collect();
+        assert_eq!(backups.len(), 5);
+        assert!(!backups.contains(&"config.bak.old0.json".to_owned()));
+        assert!(!backups.contains(&"config.bak.old1.json".to_owned()));
+    }
+
+    #[test]
+    fn test_load_or_create_config_keeps_backup_of_old_config() {
+        use std::time::{Duration, UNIX_EPOCH};
+        use tempfile::TempDir;
+
+        let _lock = TEST_MUTEX
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner);
+        clear_env_vars();
+
+        let tmp_dir = TempDir::new().expect("create temp dir");
+        let config_path = tmp_dir.path().join("config.json");
+        save_config(&config_path, &ServerConfig::default());
+        // A config restored with its original timestamp is older than every backup.
+        fs::File::options()
+            .write(true)
+            .open(&config_path)
+            .unwrap()
+            .set_modified(UNIX_EPOCH + Duration::from_secs(1_000))
+            .unwrap();
+        for i in 0..5 {
+            let backup = tmp_dir.path().join(format!("config.bak.old{i}.json"));
+            let file = fs::File::create(&backup).unwrap();
+            file.set_modified(UNIX_EPOCH + Duration::from_secs(2_000 + i))
+                .unwrap();
+        }
+
+        unsafe {
+            env::set_var("THREAT_BONUS", "5.0");
+        }
+        load_or_create_config(&config_path);
+        clear_env_vars();
+
+        let backups: Vec<String> = fs::read_dir(tmp_dir.path())
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name().to_string_lossy().into_owned())
+            .filter(|name| name.starts_with("config.bak."))
+            .collect();
+        assert_eq!(backups.len(), 5);
+        assert!(backups.iter().any(|name| !name.contains(".old")));
+        assert!(!backups.contains(&"config.bak.old0.json".to_owned()));
+    }
+
+    #[test]
+    fn test_load_or_create_config_backup_keeps_previous_contents() {
+        use tempfile::TempDir;
+
+        let _lock = TEST_MUTEX
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner);
+        clear_env_vars();
+
+        let tmp_dir = TempDir::new().expect("create temp dir");
+        let config_path = tmp_dir.path().join("config.json");
+        save_config(&config_path, &ServerConfig::default());
+        let previous = fs::read_to_string(&config_path).unwrap();
+
+        unsafe {
+            env::set_var("THREAT_BONUS", "5.0");
+        }
+        let loaded = load_or_create_config(&config_path);
+        clear_env_vars();
+
+        let backup = fs::read_dir(tmp_dir.path())
+            .unwrap()
+            .map(|entry| entry.unwrap().path())
+            .find(|path| path.to_string_lossy().contains("config.bak."))
+            .expect("backup should be created");
+        assert_eq!(fs::read_to_string(backup).unwrap(), previous);
+        assert_eq!(loaded.game_settings.threat_bonus, 5.0);
+        assert_ne!(fs::read_to_string(&config_path).unwrap(), previous);
+    }
+
     #[test]
     fn test_preserve_and_override_with_env() {
         use std::fs;
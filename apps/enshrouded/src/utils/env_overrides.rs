@@ -3,8 +3,7 @@ use std::env;
 
 /// Applies environment variable overrides to the config.
 pub fn apply_env_overrides(config: &mut ServerConfig) {
-    let env_config = crate::game_settings::GameSettings::from_env();
-    config.game_settings.merge_env(&env_config);
+    config.game_settings.merge_env();
 
     for (key, value) in env::vars() {
         if let Some(stripped) = key.strip_prefix("SET_GROUP_") {
@@ -1,24 +1,27 @@
-use regex::Regex;
-use std::sync::LazyLock;
-
-#[allow(clippy::expect_used)]
-static JOINED_RE: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"Player\s+'([^']+)'").expect("joined-player regex should compile")
-});
-
-#[allow(clippy::expect_used)]
-static LEFT_RE: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"Remove Entity for Player\s+'([^']+)'").expect("left-player regex should compile")
-});
+/// Returns the first non-empty, single-quoted name that follows `marker` and at
+/// least one whitespace character, e.g. `Player 'name'`.
+///
+/// Both markers are fixed strings, so a substring search is enough; this keeps
+/// the log-line hot path free of regex matching.
+fn quoted_name_after<'a>(log: &'a str, marker: &str) -> Option<&'a str> {
+    log.match_indices(marker).find_map(|(start, _)| {
+        let rest = log.get(start + marker.len()..)?;
+        let unpadded = rest.trim_start();
+        if unpadded.len() == rest.len() {
+            return None;
+        }
+        let quoted = unpadded.strip_prefix('\'')?;
+        let end = quoted.find('\'')?;
+        quoted.get(..end).filter(|name| !name.is_empty())
+    })
+}
 
 /// Extracts the player name from a log line.
 ///
 /// The log line is expected to contain a player name wrapped in single quotes,
 /// e.g., "[server] Player 'mbround18' logged in with Permissions:".
 pub fn extract_player_joined_name(log: &str) -> Option<String> {
-    JOINED_RE
-        .captures(log)
-        .and_then(|caps| caps.get(1).map(|m| m.as_str().to_owned()))
+    quoted_name_after(log, "Player").map(str::to_owned)
 }
 
 /// Extracts the player name from a log line when a player leaves.
@@ -26,9 +29,7 @@ pub fn extract_player_joined_name(log: &str) -> Option<String> {
 /// The log line is expected to follow the format:
 /// `[server] Remove Player 'mbround18'`
 pub fn extract_player_left_name(log: &str) -> Option<String> {
-    LEFT_RE
-        .captures(log)
-        .and_then(|caps| caps.get(1).map(|m| m.as_str().to_owned()))
+    quoted_name_after(log, "Remove Entity for Player").map(str::to_owned)
 }
 
 #[cfg(test)]
@@ -62,6 +63,16 @@ mod tests {
         assert_eq!(extract_player_joined_name(""), None);
     }
 
+    #[test]
+    fn joined_requires_whitespace_and_a_non_empty_name() {
+        assert_eq!(extract_player_joined_name("Player'nospace'"), None);
+        assert_eq!(
+            extract_player_joined_name("Player '' then Player 'b'"),
+            Some("b".to_owned())
+        );
+        assert_eq!(extract_player_joined_name("Player 'unterminated"), None);
+    }
+
     #[test]
     fn left_extracts_name_from_log_line() {
         let log = "[server] Remove Entity for Player 'mbround18'";
@@ -1,5 +1,6 @@
 use env_parse::env_parse;
 use gsm_serde::serde_ini::{IniHeader, to_string};
+use gsm_shared::write_atomic;
 use ini_derive::IniSerialize;
 use serde::{Deserialize, Serialize};
 use std::fs::create_dir_all;
@@ -765,7 +766,15 @@ pub fn save_config(path: &Path, settings: &Settings) {
         }
     };
 
-    if let Err(e) = fs::write(path, ini_config) {
+    // Leave an identical file alone rather than rewriting and syncing it again.
+    if fs::read(path).is_ok_and(|existing| existing == ini_config.as_bytes()) {
+        tracing::debug!("Config at {:?} is already up to date", path);
+        return;
+    }
+
+    // The server may read the file at any time, so replace it in one rename rather
+    // than truncating and rewriting it in place.
+    if let Err(e) = write_atomic(path, ini_config) {
         eprintln!("Failed to save config: {e}");
     }
 }
@@ -909,4 +918,34 @@ mod tests {
         assert_eq!(loaded_settings.server_name, "Default Palworld Server");
         assert_eq!(loaded_settings.exp_rate, 1.0);
     }
+
+    #[test]
+    fn test_save_config_skips_identical_contents() {
+        use std::time::{Duration, UNIX_EPOCH};
+
+        let _lock = TEST_MUTEX.lock().unwrap();
+
+        let test_path = Path::new(TEST_DIR).join("unchanged_config.ini");
+        fs::create_dir_all(TEST_DIR).unwrap();
+        let _ = fs::remove_file(&test_path);
+
+        save_config(&test_path, &Settings::default());
+        let stale = UNIX_EPOCH + Duration::from_secs(1_000);
+        fs::File::options()
+            .write(true)
+            .open(&test_path)
+            .unwrap()
+            .set_modified(stale)
+            .unwrap();
+
+        save_config(&test_path, &Settings::default());
+        let modified = fs::metadata(&test_path).unwrap().modified().unwrap();
+        assert_eq!(modified, stale);
+
+        let mut changed = Settings::default();
+        changed.option_settings.server_name = "Changed".to_owned();
+        save_config(&test_path, &changed);
+        let modified = fs::metadata(&test_path).unwrap().modified().unwrap();
+        assert_ne!(modified, stale);
+    }
 }
@@ -4,10 +4,12 @@ mod utils;
 
 use crate::environment::name;
 use clap::{Parser, Subcommand};
-use gsm_cron::{begin_cron_loop, register_job};
+use gsm_cron::{begin_cron_loop, register_job, shutdown_signal};
 use gsm_instance::{Instance, InstanceConfig};
 use gsm_monitor::LogRules;
-use gsm_notifications::notifications::{StandardServerEvents, send_notifications};
+use gsm_notifications::notifications::{
+    StandardServerEvents, flush_notifications, queue_notification, send_notifications,
+};
 use gsm_shared::{fetch_var, is_env_var_truthy};
 use std::env;
 use std::path::PathBuf;
@@ -123,11 +125,7 @@ async fn main() {
             if env::var("WEBHOOK_URL").is_ok() {
                 rules.add_rule(
                     |line| line.contains("Running Palworld dedicated server on"),
-                    |_| {
-                        if let Err(e) = send_notifications(StandardServerEvents::Started) {
-                            warn!("Failed to send webhook notification: {e}");
-                        }
-                    },
+                    |_| queue_notification(StandardServerEvents::Started),
                     false,
                     None,
                 );
@@ -136,11 +134,7 @@ async fn main() {
                     |line| line.contains("joined the server."),
                     |line| {
                         if let Some(name) = utils::extract_player_joined_name(line) {
-                            if let Err(e) =
-                                send_notifications(StandardServerEvents::PlayerJoined(name))
-                            {
-                                warn!("Failed to send webhook notification: {e}");
-                            }
+                            queue_notification(StandardServerEvents::PlayerJoined(name));
                         } else {
                             error!("Failed to extract player name from:\n{line}");
                         }
@@ -153,11 +147,7 @@ async fn main() {
                     |line| line.contains("left the server."),
                     |line| {
                         if let Some(name) = utils::extract_player_left_name(line) {
-                            if let Err(e) =
-                                send_notifications(StandardServerEvents::PlayerLeft(name))
-                            {
-                                warn!("Failed to send webhook notification: {e}");
-                            }
+                            queue_notification(StandardServerEvents::PlayerLeft(name));
                         } else {
                             error!("Failed to extract player name from:\n{line}");
                         }
@@ -197,7 +187,12 @@ async fn main() {
             }
 
             debug!("Entering cron loop (monitoring logs and scheduled tasks)...");
-            begin_cron_loop().await;
+            tokio::select! {
+                () = begin_cron_loop() => {}
+                () = shutdown_signal() => debug!("Shutdown signal received."),
+            }
+            // Deliver notifications queued by the log rules before the process exits.
+            flush_notifications();
         }
         Commands::Stop => {
             warn!("Stopping Palworld server...");
@@ -1,24 +1,28 @@
 use regex::Regex;
 use std::sync::LazyLock;
 
+/// Matches both join and leave lines in one pass; group 1 is the player name and
+/// group 2 the event.
 #[allow(clippy::expect_used)]
-static JOINED_RE: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"\[LOG\]\s+(\w+)\s+joined the server").expect("joined-player regex should compile")
+static PLAYER_EVENT_RE: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(r"\[LOG\]\s+(\w+)\s+(joined|left) the server")
+        .expect("player event regex should compile")
 });
 
-#[allow(clippy::expect_used)]
-static LEFT_RE: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"\[LOG\]\s+(\w+)\s+left the server").expect("left-player regex should compile")
-});
+/// Returns the name from the first player event in `log` that is `event`.
+fn player_name_for(log: &str, event: &str) -> Option<String> {
+    PLAYER_EVENT_RE
+        .captures_iter(log)
+        .find(|caps| caps.get(2).is_some_and(|m| m.as_str() == event))
+        .and_then(|caps| caps.get(1).map(|m| m.as_str().to_owned()))
+}
 
 /// Extracts the player name from a log line.
 ///
 /// The log line is expected to contain a timestamp, "[LOG]", then the player name
 /// before "joined the server".
 pub fn extract_player_joined_name(log: &str) -> Option<String> {
-    JOINED_RE
-        .captures(log)
-        .and_then(|caps| caps.get(1).map(|m| m.as_str().to_owned()))
+    player_name_for(log, "joined")
 }
 
 /// Extracts the player name from a log line when a player leaves.
@@ -26,9 +30,7 @@ pub fn extract_player_joined_name(log: &str) -> Option<String> {
 /// The log line is expected to contain a timestamp, "[LOG]", then the player name
 /// before "left the server".
 pub fn extract_player_left_name(log: &str) -> Option<String> {
-    LEFT_RE
-        .captures(log)
-        .and_then(|caps| caps.get(1).map(|m| m.as_str().to_owned()))
+    player_name_for(log, "left")
 }
 
 #[cfg(test)]
@@ -64,4 +66,19 @@ mod tests {
         assert_eq!(extract_player_left_name("[server] Server started."), None);
         assert_eq!(extract_player_left_name(""), None);
     }
+
+    #[test]
+    fn events_do_not_match_each_other() {
+        let joined = "[2024.01.01-00.00.00:000][  0]LogNet: [LOG] mbround18 joined the server";
+        let left = "[2024.01.01-00.00.00:000][  0]LogNet: [LOG] mbround18 left the server";
+        assert_eq!(extract_player_left_name(joined), None);
+        assert_eq!(extract_player_joined_name(left), None);
+    }
+
+    #[test]
+    fn finds_each_event_when_a_line_has_both() {
+        let log = "[LOG] alice left the server [LOG] bob joined the server";
+        assert_eq!(extract_player_left_name(log), Some("alice".to_owned()));
+        assert_eq!(extract_player_joined_name(log), Some("bob".to_owned()));
+    }
 }
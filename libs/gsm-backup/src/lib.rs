@@ -8,13 +8,13 @@
 //! files, such as auto-backups, to avoid redundant data in the archives.
 use flate2::Compression;
 use flate2::write::GzEncoder;
-use glob::glob;
-use std::fs::{File, remove_file};
+use std::fs::{File, remove_file, rename};
 use std::io::{Error as IoError, ErrorKind};
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use tar::Builder;
 use thiserror::Error;
 use tracing::{debug, error, info};
+use walkdir::WalkDir;
 
 /// Custom error type for backup failures.
 ///
@@ -23,10 +23,6 @@ use tracing::{debug, error, info};
 pub enum BackupError {
     #[error("Failed to create backup file at {0}")]
     CreateBackupError(String),
-    #[error("Glob pattern error: {0}")]
-    GlobPatternError(#[from] glob::PatternError),
-    #[error("Error reading glob entry: {0}")]
-    GlobEntryError(#[from] glob::GlobError),
     #[error("Tar archive error: {0}")]
     TarError(String),
     #[error("I/O error: {0}")]
@@ -49,19 +45,19 @@ pub enum BackupError {
 /// # Behavior
 ///
 /// - The function recursively includes all files and directories under the `input` path.
-/// - Any file or directory whose path contains the substring `"backup_auto"` will be skipped.
-///   This is useful for excluding auto-generated backups from a manual backup.
+/// - Any file or directory whose name contains the substring `"backup_auto"` will be skipped,
+///   and directories matching it are not descended into. This is useful for excluding
+///   auto-generated backups from a manual backup.
 /// - The backup file is created using a gzip encoder with default compression settings.
-/// - If an error occurs during the archiving process, the partially created output file
-///   will be deleted to avoid leaving incomplete backups.
+/// - The archive is written to a `.partial` file next to `output` and renamed into place
+///   only once it is complete, so `output` never holds a truncated archive. If an error
+///   occurs, the partial file is deleted and any previous backup at `output` is kept.
 ///
 /// # Errors
 ///
 /// This function will return a `BackupError` if any of the following occurs:
 /// - The `input` directory does not exist or is not a directory.
 /// - The `output` file cannot be created (e.g., due to file permissions).
-/// - A glob pattern for traversing files is invalid.
-/// - An error occurs while reading a file or directory entry.
 /// - A file cannot be added to the tar archive.
 /// - The tar archive cannot be finalized.
 ///
@@ -87,10 +83,6 @@ pub enum BackupError {
 /// # Ok(())
 /// # }
 /// ```
-///
-/// # Panics
-///
-/// Panics if internal glob pattern expansion fails while enumerating the input tree.
 pub fn backup<P, Q>(input: P, output: Q) -> Result<(), BackupError>
 where
     P: AsRef<Path>,
@@ -113,44 +105,79 @@ where
     debug!("Creating archive of {:?}", input);
     debug!("Output set to {:?}", output);
 
-    // Attempt to create the output backup file.
-    let tar_gz = File::create(output)
+    // Attempt to create the in-progress backup file next to the final output.
+    let partial = partial_path(output);
+    let tar_gz = File::create(&partial)
         .map_err(|_| BackupError::CreateBackupError(format!("{}", output.display())))?;
-    let enc = GzEncoder::new(tar_gz, Compression::default());
+
+    let result = write_archive(input, tar_gz).and_then(|file| {
+        file.sync_all()?;
+        rename(&partial, output)?;
+        Ok(())
+    });
+    if result.is_err() {
+        let _ = remove_file(&partial);
+    }
+    result
+}
+
+/// Returns the path the archive is built at before being renamed to `output`.
+fn partial_path(output: &Path) -> PathBuf {
+    let mut partial = output.as_os_str().to_owned();
+    partial.push(".partial");
+    PathBuf::from(partial)
+}
+
+/// Writes every entry under `input` into a gzip-compressed tar stream on `file`
+/// and returns the file once the archive has been fully flushed.
+fn write_archive(input: &Path, file: File) -> Result<File, BackupError> {
+    let enc = GzEncoder::new(file, Compression::default());
     let mut tar = Builder::new(enc);
 
-    // Build a glob pattern for all files and directories under the input.
-    let pattern = format!("{}/**/*", input.display());
-    let entries = glob(&pattern).map_err(BackupError::GlobPatternError)?;
+    // Prune "backup_auto" entries during the walk so their subtrees are never
+    // read, rather than listing everything and discarding them afterwards.
+    // Symlinked directories are descended into so saves mounted through a link
+    // are archived rather than reduced to an empty directory entry.
+    let entries = WalkDir::new(input)
+        .follow_links(true)
+        .min_depth(1)
+        .sort_by_file_name()
+        .into_iter()
+        .filter_entry(|entry| !entry.file_name().to_string_lossy().contains("backup_auto"));
 
+    let mut added = 0usize;
     for entry in entries {
         match entry {
-            Ok(path) => {
-                let path_str = path.to_string_lossy().into_owned();
-                // Skip files whose names contain "backup_auto"
-                if path_str.contains("backup_auto") {
-                    continue;
-                }
+            Ok(entry) => {
+                let path = entry.path();
+                let path_str = path.to_string_lossy();
                 // Compute the relative path from the input directory.
-                let relative = path.strip_prefix(input).unwrap_or(&path);
-                info!(
+                let relative = path.strip_prefix(input).unwrap_or(path);
+                debug!(
                     "Adding {} to backup file, with relative path {:?}",
                     path_str, relative
                 );
-                if let Err(err) = tar.append_path_with_name(&path, relative) {
+                if let Err(err) = tar.append_path_with_name(path, relative) {
                     error!("Failed to add {} to backup file", path_str);
                     error!("Backup error: {err}");
-                    let _ = remove_file(output);
                     return Err(BackupError::TarError(err.to_string()));
                 }
-                debug!("Successfully added {} to backup file", path_str);
+                added += 1;
             }
-            Err(e) => error!("Error reading glob entry: {:?}", e),
+            Err(e) => error!("Error reading directory entry: {:?}", e),
         }
     }
-    tar.finish()
+    info!(
+        "Added {added} entries from {} to backup file",
+        input.display()
+    );
+
+    // Finish both the tar stream and the gzip trailer explicitly so that write
+    // errors surface here instead of being swallowed when the encoder drops.
+    let enc = tar
+        .into_inner()
         .map_err(|e| BackupError::TarError(e.to_string()))?;
-    Ok(())
+    Ok(enc.finish()?)
 }
 
 #[cfg(test)]
@@ -215,6 +242,39 @@ mod tests {
         assert!(archived_files.iter().any(|s| s.contains("foo.txt")));
         assert!(archived_files.iter().any(|s| s.contains("sub/bar.txt")));
         assert!(!archived_files.iter().any(|s| s.contains("backup_auto")));
+        assert!(!partial_path(&backup_path).exists());
+    }
+
+    #[test]
+    fn test_backup_skips_backup_auto_directories() {
+        let test_dir = setup_test_dir();
+        let auto_dir = test_dir.path().join("backup_auto").join("nested");
+        fs::create_dir_all(&auto_dir).unwrap();
+        fs::write(auto_dir.join("save.dat"), "old save").unwrap();
+        let backup_file = NamedTempFile::new().expect("Failed to create temp file");
+
+        backup(test_dir.path(), backup_file.path()).expect("Backup failed");
+
+        let archived_files = read_archive(backup_file.path());
+        assert!(archived_files.iter().any(|s| s.contains("sub/bar.txt")));
+        assert!(!archived_files.iter().any(|s| s.contains("save.dat")));
+        assert!(!archived_files.iter().any(|s| s.contains("backup_auto")));
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn test_backup_follows_symlinked_directories() {
+        let test_dir = setup_test_dir();
+        let saves = tempdir().unwrap();
+        fs::write(saves.path().join("world.sav"), "linked save").unwrap();
+        std::os::unix::fs::symlink(saves.path(), test_dir.path().join("saves")).unwrap();
+        let backup_file = NamedTempFile::new().expect("Failed to create temp file");
+
+        backup(test_dir.path(), backup_file.path()).expect("Backup failed");
+
+        let archived_files = read_archive(backup_file.path());
+        assert!(archived_files.iter().any(|s| s == "saves/world.sav"));
+        assert!(archived_files.iter().any(|s| s.contains("sub/bar.txt")));
     }
 
     #[test]
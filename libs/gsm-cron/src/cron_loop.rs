@@ -3,6 +3,7 @@
 //! This module provides the main event loop for the cron scheduler.
 use std::time::Duration;
 use tokio::time::sleep;
+use tracing::warn;
 
 /// Begins the main cron loop, which runs indefinitely.
 ///
@@ -41,6 +42,32 @@ pub async fn begin_cron_loop() {
     }
 }
 
+/// Resolves once the process is asked to stop with Ctrl+C, or SIGTERM on Unix.
+///
+/// Race it against `begin_cron_loop` with `tokio::select!` so the caller gets a chance
+/// to clean up, such as flushing queued notifications, before the process exits.
+pub async fn shutdown_signal() {
+    #[cfg(unix)]
+    {
+        use tokio::signal::unix::{SignalKind, signal};
+        match signal(SignalKind::terminate()) {
+            Ok(mut terminate) => {
+                tokio::select! {
+                    _ = tokio::signal::ctrl_c() => {}
+                    _ = terminate.recv() => {}
+                }
+                return;
+            }
+            Err(e) => warn!("Failed to listen for SIGTERM: {e}"),
+        }
+    }
+    if let Err(e) = tokio::signal::ctrl_c().await {
+        // Without a signal to wait for, never resolve rather than stopping at once.
+        warn!("Failed to listen for Ctrl+C: {e}");
+        std::future::pending::<()>().await;
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
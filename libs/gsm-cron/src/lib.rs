@@ -9,18 +9,21 @@ mod cron_loop;
 
 use chrono::Utc;
 use cron::Schedule;
+use std::borrow::Cow;
 use std::str::FromStr;
 use tokio::time::{Duration, sleep};
 use tracing::{debug, error, info};
 
-pub use cron_loop::begin_cron_loop;
+pub use cron_loop::{begin_cron_loop, shutdown_signal};
 
-fn normalize_schedule(schedule: &str) -> String {
-    let field_count = schedule.split_whitespace().count();
-    if field_count == 5 {
-        format!("0 {schedule}")
+/// Prepends a seconds field to 5-field cron expressions. Other schedules are
+/// borrowed unchanged, so an owned result means the schedule was adjusted.
+fn normalize_schedule(schedule: &str) -> Cow<'_, str> {
+    // Counting stops after a sixth field; only "exactly five" matters.
+    if schedule.split_whitespace().take(6).count() == 5 {
+        Cow::Owned(format!("0 {schedule}"))
     } else {
-        schedule.to_owned()
+        Cow::Borrowed(schedule)
     }
 }
 
@@ -110,7 +113,7 @@ where
 {
     let name_owned = name.to_owned();
     let adjusted_schedule = normalize_schedule(schedule);
-    if schedule.split_whitespace().count() == 5 {
+    if matches!(adjusted_schedule, Cow::Owned(_)) {
         debug!(
             "Adjusted schedule from 5-field to 6-field for job '{}': {} (original: {})",
             name_owned, adjusted_schedule, schedule
@@ -145,6 +148,10 @@ mod tests {
     #[test]
     fn normalize_schedule_leaves_six_part_cron_unchanged() {
         assert_eq!(normalize_schedule("0 * * * * *"), "0 * * * * *");
+        assert!(matches!(
+            normalize_schedule("0 * * * * * 2030"),
+            Cow::Borrowed("0 * * * * * 2030")
+        ));
     }
 
     #[tokio::test]
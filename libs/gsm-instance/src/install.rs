@@ -105,13 +105,14 @@ pub fn install<P: AsRef<Path>>(
         format!("+app_update {app_id} validate")
     };
 
-    // Start building the argument list.
-    let mut args = vec![force_install_dir, login, app_update];
-
+    // Start building the argument list in order, so the platform override
+    // never has to be inserted ahead of the base arguments.
+    let mut args = Vec::with_capacity(extra_args.len() + 4);
     if force_windows {
         let platform = "windows";
-        args.insert(0, format!("+@sSteamCmdForcePlatformType {platform}"));
+        args.push(format!("+@sSteamCmdForcePlatformType {platform}"));
     }
+    args.extend([force_install_dir, login, app_update]);
 
     // Append any extra installation arguments.
     args.extend_from_slice(extra_args);
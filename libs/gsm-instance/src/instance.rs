@@ -3,6 +3,7 @@ use crate::errors::InstanceError;
 use crate::process::send_interrupt_to_pid;
 use crate::{install, startup, update};
 use std::fs;
+use std::io;
 use std::path::PathBuf;
 use std::process::Child; // Using synchronous std process Child
 use tracing::warn;
@@ -30,15 +31,17 @@ impl Instance {
     /// an invalid integer PID.
     pub fn pid(&self) -> Result<u32, InstanceError> {
         let pid_file = self.config.pid_file();
-        if pid_file.exists() {
-            // Read the PID from the file
-            return fs::read_to_string(&pid_file)
-                .map_err(InstanceError::IoError)?
+        // Read the PID directly; a missing file surfaces as `NotFound`.
+        match fs::read_to_string(&pid_file) {
+            Ok(contents) => contents
                 .trim()
                 .parse::<u32>()
-                .map_err(InstanceError::ParseError);
+                .map_err(InstanceError::ParseError),
+            Err(e) if e.kind() == io::ErrorKind::NotFound => {
+                Err(InstanceError::Unknown("Failed to find pid".to_owned()))
+            }
+            Err(e) => Err(InstanceError::IoError(e)),
         }
-        Err(InstanceError::Unknown("Failed to find pid".to_owned()))
     }
 
     /// Installs the server using SteamCMD.
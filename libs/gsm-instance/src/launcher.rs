@@ -364,10 +364,8 @@ mod tests {
         fs::set_permissions(path, permissions).unwrap();
     }
 
-    /// Creates a basic InstanceConfig for testing the launcher.
-    fn test_config(launch_mode: LaunchMode) -> InstanceConfig {
-        let temp_dir = tempdir().unwrap();
-        let path = temp_dir.keep();
+    /// Creates a basic InstanceConfig for testing the launcher, rooted in `working_dir`.
+    fn test_config(working_dir: &std::path::Path, launch_mode: LaunchMode) -> InstanceConfig {
         InstanceConfig {
             app_id: 123456,
             name: "TestServer".to_owned(),
@@ -375,7 +373,7 @@ mod tests {
             install_args: vec![],
             launch_args: vec![dummy_arg()],
             launch_mode,
-            working_dir: path,
+            working_dir: working_dir.to_path_buf(),
             force_windows: false,
             skip_validate: false,
         }
@@ -388,7 +386,8 @@ mod tests {
             eprintln!("wine64 not found, skipping test_launch_server_with_wine");
             return;
         }
-        let config = test_config(LaunchMode::Wine);
+        let temp_dir = tempdir().unwrap();
+        let config = test_config(temp_dir.path(), LaunchMode::Wine);
         let command_result = launch_server(&config);
         assert!(command_result.is_ok());
         let mut command = command_result.unwrap();
@@ -399,7 +398,8 @@ mod tests {
 
     #[test]
     fn launch_server_creates_expected_log_files() {
-        let config = test_config(LaunchMode::Native);
+        let temp_dir = tempdir().unwrap();
+        let config = test_config(temp_dir.path(), LaunchMode::Native);
 
         let command_result = launch_server(&config);
         assert!(command_result.is_ok());
@@ -436,11 +436,12 @@ mod tests {
 
     #[test]
     fn launch_server_with_launch_args_appends_args_to_command() {
+        let temp_dir = tempdir().unwrap();
         let config = InstanceConfig {
             command: dummy_command(),
             launch_args: vec!["--arg1".to_owned(), "--arg2".to_owned()],
             launch_mode: LaunchMode::Native,
-            ..test_config(LaunchMode::Native)
+            ..test_config(temp_dir.path(), LaunchMode::Native)
         };
 
         let cmd = launch_server(&config).unwrap();
@@ -459,9 +460,10 @@ mod tests {
             .lock()
             .unwrap_or_else(std::sync::PoisonError::into_inner);
 
-        let temp_home = tempdir().unwrap().keep();
+        let temp_dir = tempdir().unwrap();
+        let temp_home = temp_dir.path();
         unsafe {
-            std::env::set_var("HOME", &temp_home);
+            std::env::set_var("HOME", temp_home);
             // Ensure FORCE_PROTON is not set so we don't get a different error.
             std::env::remove_var("FORCE_PROTON");
             std::env::remove_var("PROTON_VERSION");
@@ -502,14 +504,15 @@ mod tests {
             .lock()
             .unwrap_or_else(std::sync::PoisonError::into_inner);
 
-        let temp_home = tempdir().unwrap().keep();
+        let temp_dir = tempdir().unwrap();
+        let temp_home = temp_dir.path();
         let proton_dir = temp_home.join(".steam/steam/compatibilitytools.d/GE-Protontemp-test");
         fs::create_dir_all(&proton_dir).unwrap();
         let proton_path = proton_dir.join("proton");
         write_executable_script(&proton_path, "#!/bin/sh\nexit 0\n");
 
         unsafe {
-            std::env::set_var("HOME", &temp_home);
+            std::env::set_var("HOME", temp_home);
             std::env::set_var("PROTON_VERSION", "temp-test");
         }
 
@@ -553,9 +556,10 @@ mod tests {
             .lock()
             .unwrap_or_else(std::sync::PoisonError::into_inner);
 
-        let temp_home = tempdir().unwrap().keep();
+        let temp_dir = tempdir().unwrap();
+        let temp_home = temp_dir.path();
         unsafe {
-            std::env::set_var("HOME", &temp_home);
+            std::env::set_var("HOME", temp_home);
             std::env::set_var("FORCE_PROTON", "1");
             std::env::set_var("PROTON_VERSION", "missing-version-xyz");
         }
@@ -1,6 +1,6 @@
 use std::cmp::Ordering;
 use strsim::jaro_winkler;
-use sysinfo::{Pid, Signal, System};
+use sysinfo::{Pid, ProcessRefreshKind, ProcessesToUpdate, Signal, System};
 use tracing::{debug, error, info}; // Fuzzy matching
 
 /// Sends an interrupt signal (SIGINT) to the process with the given PID.
@@ -8,16 +8,18 @@ use tracing::{debug, error, info}; // Fuzzy matching
 /// # Parameters
 /// - `pid`: The process ID to send SIGINT to.
 pub fn send_interrupt_to_pid(pid: u32) {
-    let mut sys = System::new_all();
-    sys.refresh_all();
+    // Only the one process is needed; a full `refresh_all` would also load every
+    // other process, disk, network interface and component on the host.
     let sys_pid = Pid::from(pid as usize);
+    let mut sys = System::new();
+    sys.refresh_processes_specifics(
+        ProcessesToUpdate::Some(&[sys_pid]),
+        true,
+        ProcessRefreshKind::nothing(),
+    );
     if let Some(process) = sys.process(sys_pid) {
         info!("Found process with PID: {}", pid);
-        if process.kill_with(Signal::Interrupt).is_some() {
-            info!("Sent interrupt signal to PID: {}", pid);
-        } else {
-            error!("Failed to send interrupt signal to PID: {}", pid);
-        }
+        interrupt_process(process);
     } else {
         debug!(
             "Process with PID {} not found (it may have already stopped)",
@@ -26,17 +28,40 @@ pub fn send_interrupt_to_pid(pid: u32) {
     }
 }
 
+/// Sends an interrupt signal (SIGINT) to a process that has already been looked up.
+fn interrupt_process(process: &sysinfo::Process) {
+    let pid = process.pid().as_u32();
+    if process.kill_with(Signal::Interrupt).is_some() {
+        info!("Sent interrupt signal to PID: {}", pid);
+    } else {
+        error!("Failed to send interrupt signal to PID: {}", pid);
+    }
+}
+
+/// Minimum Jaro-Winkler similarity for a process name to count as a match.
+const MATCH_THRESHOLD: f64 = 0.75;
+
+/// Scores how closely a process name matches an already-lowercased executable name.
+fn name_similarity(executable_name: &str, process: &sysinfo::Process) -> f64 {
+    let binding = process.name().to_ascii_lowercase();
+    let process_name = binding.to_str().unwrap_or("unknown");
+    jaro_winkler(executable_name, process_name)
+}
+
 /// A struct for managing server processes.
 pub struct ServerProcess {
     system: System,
 }
 
 impl ServerProcess {
-    /// Creates a new instance of `ServerProcess` by initializing the system information.
+    /// Creates a new instance of `ServerProcess`.
+    ///
+    /// The process table is loaded lazily by [`ServerProcess::find_processes`], so
+    /// construction itself does not scan the system.
     pub fn new() -> Self {
-        let mut sys = System::new_all();
-        sys.refresh_all();
-        Self { system: sys }
+        Self {
+            system: System::new(),
+        }
     }
 
     /// Finds all processes whose executable path contains the specified substring.
@@ -47,7 +72,7 @@ impl ServerProcess {
     /// # Returns
     /// A vector of references to matching processes.
     pub fn find_processes(&mut self, executable_name: &str) -> Vec<&sysinfo::Process> {
-        self.system.refresh_all();
+        self.refresh_process_names();
         let executable_name = executable_name.to_ascii_lowercase();
 
         debug!(
@@ -60,14 +85,8 @@ impl ServerProcess {
             .system
             .processes()
             .values()
-            .map(|process| {
-                let binding = process.name().to_ascii_lowercase();
-
-                let process_name = binding.to_str().unwrap_or("unknown");
-                let similarity = jaro_winkler(&executable_name, process_name);
-                (process, similarity)
-            })
-            .filter(|(_, similarity)| *similarity > 0.75) // Only consider high-confidence matches
+            .map(|process| (process, name_similarity(&executable_name, process)))
+            .filter(|(_, similarity)| *similarity > MATCH_THRESHOLD) // Only consider high-confidence matches
             .collect();
 
         // Sort by confidence score (descending)
@@ -79,7 +98,25 @@ impl ServerProcess {
 
     /// Returns true if any process matching the given executable substring is running.
     pub fn are_processes_running(&mut self, executable_name: &str) -> bool {
-        !self.find_processes(executable_name).is_empty()
+        // Only existence matters, so stop at the first match instead of scoring,
+        // collecting and sorting every process as `find_processes` does.
+        self.refresh_process_names();
+        let executable_name = executable_name.to_ascii_lowercase();
+        self.system
+            .processes()
+            .values()
+            .any(|process| name_similarity(&executable_name, process) > MATCH_THRESHOLD)
+    }
+
+    /// Reloads the process table with just the process names.
+    fn refresh_process_names(&mut self) {
+        // Matching only needs each process's name, which is always loaded; skip the
+        // CPU, memory, disk and executable details a default refresh reads per process.
+        self.system.refresh_processes_specifics(
+            ProcessesToUpdate::All,
+            true,
+            ProcessRefreshKind::nothing(),
+        );
     }
 
     /// Sends an interrupt signal (SIGINT) to all processes whose executable path contains the given substring.
@@ -96,16 +133,17 @@ impl ServerProcess {
             return;
         }
 
+        // Signal the processes from the scan we just did rather than rescanning
+        // the whole process table once per PID.
         for process in processes {
-            let pid = process.pid().as_u32();
-            info!("Sending interrupt to process with PID: {}", pid);
-            send_interrupt_to_pid(pid);
+            info!("Sending interrupt to process with PID: {}", process.pid());
+            interrupt_process(process);
         }
     }
 }
 
 /// Manual implementation of Clone for ServerProcess.
-/// This simply creates a new instance to refresh system information.
+/// This simply creates a new instance; processes are refreshed on the next lookup.
 impl Clone for ServerProcess {
     fn clone(&self) -> Self {
         Self::new()
@@ -8,17 +8,21 @@
 //! versions from GitHub, and set up the necessary environment for a game server to
 //! use Proton.
 use flate2::read::GzDecoder;
-use glob::glob;
+use glob::{Pattern, glob};
 use reqwest;
+use std::collections::HashMap;
 use std::env;
-use std::fs::{File, create_dir_all};
+use std::ffi::OsStr;
+use std::fs::{create_dir_all, read_dir, remove_dir_all, rename};
 use std::io;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::sync::LazyLock;
+use std::time::Duration;
 use tar::Archive;
-use tempfile::tempdir;
+use tempfile::Builder;
 use thiserror::Error;
-use tracing::{debug, info};
+use tracing::{debug, info, warn};
 use which::which;
 
 mod releases;
@@ -29,6 +33,33 @@ pub use releases::{
 };
 pub use types::{ProtonRelease, ProtonVersion, VersionError, parse_version};
 
+/// HTTP client shared by every GitHub request made for Proton, so repeated
+/// lookups and downloads reuse pooled keep-alive connections.
+#[allow(clippy::expect_used)]
+static HTTP_CLIENT: LazyLock<reqwest::blocking::Client> = LazyLock::new(|| {
+    reqwest::blocking::Client::builder()
+        .user_agent("gsm-instance")
+        .build()
+        .expect("proton HTTP client should build")
+});
+
+/// Prefix of the hidden directories Proton archives are extracted into.
+const STAGING_PREFIX: &str = ".gsm-proton-";
+
+/// Age after which a staging directory is assumed to be left over from an
+/// interrupted download rather than one still in progress.
+const STALE_STAGING_AGE: Duration = Duration::from_secs(24 * 60 * 60);
+
+/// Matches the install directory name of any Proton build.
+#[allow(clippy::expect_used)]
+static ANY_PROTON_NAME: LazyLock<Pattern> =
+    LazyLock::new(|| Pattern::new("*Proton*").expect("proton name pattern should compile"));
+
+/// Matches the install directory name of a GE Proton build.
+#[allow(clippy::expect_used)]
+static GE_PROTON_NAME: LazyLock<Pattern> =
+    LazyLock::new(|| Pattern::new("GE-Proton*").expect("GE proton name pattern should compile"));
+
 /// Represents errors that can occur during Proton-related operations.
 #[derive(Error, Debug)]
 pub enum ProtonError {
@@ -108,56 +139,73 @@ pub fn find_proton(version: Option<&str>) -> Result<ProtonConfig, ProtonError> {
     let home = env::var("HOME").unwrap_or_else(|_| "/home/steam".to_owned());
     let proton_dir = env::var("PROTON_DIR").unwrap_or_else(|_| format!("{home}/proton"));
 
-    // Try glob search in common compatibility tools directories first
-    let glob_patterns = [
-        "/home/steam/.steam/root/compatibilitytools.d/*Proton*/proton".to_owned(),
-        "/home/steam/.steam/steam/compatibilitytools.d/*Proton*/proton".to_owned(),
-        format!("{home}/.local/share/Steam/compatibilitytools.d/*Proton*/proton"),
-        format!("{home}/.steam/root/compatibilitytools.d/*Proton*/proton"),
-        format!("{home}/.steam/steam/compatibilitytools.d/*Proton*/proton"),
-        format!("{home}/.steam/compatibilitytools.d/*Proton*/proton"),
-        format!("{proton_dir}/GE-Proton*/proton"),
-        format!("{proton_dir}/*Proton*/proton"),
+    // Proton installs live at `<dir>/<name>/proton`, where `<name>` matches the
+    // pattern paired with each compatibility tools directory. The patterns are
+    // compiled once and shared rather than rebuilt for every directory.
+    let any_proton: &Pattern = &ANY_PROTON_NAME;
+    let ge_proton: &Pattern = &GE_PROTON_NAME;
+    let search_dirs = [
+        (
+            "/home/steam/.steam/root/compatibilitytools.d".to_owned(),
+            any_proton,
+        ),
+        (
+            "/home/steam/.steam/steam/compatibilitytools.d".to_owned(),
+            any_proton,
+        ),
+        (
+            format!("{home}/.local/share/Steam/compatibilitytools.d"),
+            any_proton,
+        ),
+        (
+            format!("{home}/.steam/root/compatibilitytools.d"),
+            any_proton,
+        ),
+        (
+            format!("{home}/.steam/steam/compatibilitytools.d"),
+            any_proton,
+        ),
+        (format!("{home}/.steam/compatibilitytools.d"), any_proton),
+        (proton_dir.clone(), ge_proton),
+        (proton_dir.clone(), any_proton),
     ];
 
+    // List every directory once and match install names in memory, rather than
+    // globbing each directory again for the version search and the generic one.
+    let dirs: Vec<&str> = search_dirs.iter().map(|(dir, _)| dir.as_str()).collect();
+    let listings = list_proton_dirs(&dirs);
+
     // If version is specified, try to find a specific version first
     if let Some(v) = version {
         debug!("Searching for specific Proton version: {}", v);
-
-        for pattern in &glob_patterns {
-            let version_pattern = pattern.replace("*Proton*", &format!("*{v}*"));
-            debug!("Trying pattern: {}", version_pattern);
-
-            if let Ok(paths) = glob(&version_pattern) {
-                for path in paths.flatten() {
-                    if path.is_file() {
-                        debug!("Found specific Proton version at: {:?}", path);
-                        return create_proton_config(&path, v);
-                    }
-                }
+        // The version pattern is compiled once; it narrows the generic entries,
+        // while GE-only entries keep their own pattern.
+        if let Ok(version_name) = Pattern::new(&format!("*{v}*")) {
+            let version_dirs: Vec<(&str, &Pattern)> = search_dirs
+                .iter()
+                .map(|(dir, name)| {
+                    let name = if *name == any_proton {
+                        &version_name
+                    } else {
+                        *name
+                    };
+                    (dir.as_str(), name)
+                })
+                .collect();
+            if let Some(path) = first_matching_install(&version_dirs, &listings) {
+                debug!("Found specific Proton version at: {:?}", path);
+                return create_proton_config(path, v);
             }
         }
     }
 
     // If specific version wasn't found or not specified, try generic patterns
     debug!("Searching for any Proton version using glob patterns");
-    for pattern in &glob_patterns {
-        debug!("Trying pattern: {}", pattern);
-        if let Ok(paths) = glob(pattern) {
-            for path in paths.flatten() {
-                if path.is_file() {
-                    debug!("Found Proton at: {:?}", path);
-                    // Extract version from path
-                    let version = path
-                        .parent()
-                        .and_then(|p| p.file_name())
-                        .and_then(|n| n.to_str())
-                        .unwrap_or("unknown");
-
-                    return create_proton_config(&path, version);
-                }
-            }
-        }
+    if let Some(path) = first_matching_install(&search_dirs, &listings) {
+        debug!("Found Proton at: {:?}", path);
+        // Extract version from path
+        let version = install_name(path).unwrap_or("unknown");
+        return create_proton_config(path, version);
     }
 
     // If glob search failed, try specific paths
@@ -198,6 +246,48 @@ pub fn find_proton(version: Option<&str>) -> Result<ProtonConfig, ProtonError> {
     ))
 }
 
+/// Lists the Proton installs of each distinct directory, keyed by directory.
+fn list_proton_dirs<'a>(dirs: &[&'a str]) -> HashMap<&'a str, Vec<PathBuf>> {
+    let mut listings = HashMap::with_capacity(dirs.len());
+    for &dir in dirs {
+        listings.entry(dir).or_insert_with(|| {
+            debug!("Listing Proton installs in: {}", dir);
+            list_proton_candidates(dir)
+        });
+    }
+    listings
+}
+
+/// Lists every `<dir>/*/proton` executable, in glob order.
+fn list_proton_candidates(dir: &str) -> Vec<PathBuf> {
+    glob(&format!("{dir}/*/proton")).map_or_else(
+        |_| Vec::new(),
+        |paths| paths.flatten().filter(|path| path.is_file()).collect(),
+    )
+}
+
+/// Returns the name of the install directory holding a `proton` executable.
+fn install_name(path: &Path) -> Option<&str> {
+    path.parent()
+        .and_then(Path::file_name)
+        .and_then(OsStr::to_str)
+}
+
+/// Returns the first listed executable, in search order, whose install directory
+/// name matches the pattern paired with its search directory.
+fn first_matching_install<'a, D: AsRef<str>>(
+    search_dirs: &[(D, &Pattern)],
+    listings: &'a HashMap<&str, Vec<PathBuf>>,
+) -> Option<&'a Path> {
+    search_dirs.iter().find_map(|(dir, pattern)| {
+        listings
+            .get(dir.as_ref())?
+            .iter()
+            .find(|path| install_name(path).is_some_and(|name| pattern.matches(name)))
+            .map(PathBuf::as_path)
+    })
+}
+
 /// Creates a `ProtonConfig` from a given path and version string.
 fn create_proton_config<P: AsRef<Path>>(
     path: P,
@@ -264,21 +354,25 @@ pub fn download_proton(version: &str) -> Result<ProtonConfig, ProtonError> {
 
     // Download the Proton package
     info!("Downloading Proton {} from {}", version, download_url);
-    let temp_dir = tempdir()?;
-    let tar_gz_path = temp_dir.path().join(format!("{version}.tar.gz"));
-
-    let mut response = reqwest::blocking::get(&download_url)?;
-    let mut file = File::create(&tar_gz_path)?;
-
-    response.copy_to(&mut file)?;
-    debug!("Downloaded Proton package to {:?}", tar_gz_path);
+    let response = HTTP_CLIENT.get(&download_url).send()?.error_for_status()?;
 
-    // Extract the archive
+    // Extract the archive straight from the response body instead of spooling the
+    // tarball to disk first. It is unpacked into a hidden staging directory on the
+    // same filesystem as the final location and renamed into place, so an
+    // interrupted download never leaves a half-extracted install that would later
+    // be mistaken for a complete one.
     info!("Extracting Proton to {}", target_dir);
-    let tar_gz = File::open(&tar_gz_path)?;
-    let tar = GzDecoder::new(tar_gz);
-    let mut archive = Archive::new(tar);
-    archive.unpack(&target_dir)?;
+    remove_stale_staging_dirs(Path::new(&target_dir), STALE_STAGING_AGE);
+    let staging_dir = Builder::new()
+        .prefix(STAGING_PREFIX)
+        .tempdir_in(&target_dir)?;
+    Archive::new(GzDecoder::new(response)).unpack(staging_dir.path())?;
+
+    if Path::new(&proton_dir).exists() {
+        debug!("Removing incomplete Proton install at {}", proton_dir);
+        remove_dir_all(&proton_dir)?;
+    }
+    rename(staging_dir.path().join(version), &proton_dir)?;
 
     debug!("Proton extracted successfully");
 
@@ -286,6 +380,35 @@ pub fn download_proton(version: &str) -> Result<ProtonConfig, ProtonError> {
     create_proton_config(&proton_path, version)
 }
 
+/// Removes staging directories in `target_dir` that are at least `max_age` old.
+///
+/// Those are left over from a download that was killed mid-extraction. Younger
+/// ones may belong to a download still in progress and are kept. Failures are
+/// only logged, since a leftover directory just wastes space.
+fn remove_stale_staging_dirs(target_dir: &Path, max_age: Duration) {
+    let Ok(entries) = read_dir(target_dir) else {
+        return;
+    };
+    for entry in entries.flatten() {
+        let is_staging = entry
+            .file_name()
+            .to_str()
+            .is_some_and(|name| name.starts_with(STAGING_PREFIX));
+        let is_stale = entry
+            .metadata()
+            .and_then(|metadata| metadata.modified())
+            .ok()
+            .and_then(|modified| modified.elapsed().ok())
+            .is_some_and(|age| age >= max_age);
+        if is_staging && is_stale {
+            debug!("Removing stale Proton staging directory {:?}", entry.path());
+            if let Err(e) = remove_dir_all(entry.path()) {
+                warn!("Failed to remove {:?}: {e}", entry.path());
+            }
+        }
+    }
+}
+
 /// Sets up the Proton prefix for a game.
 ///
 /// This function ensures the Wine prefix directory exists and configures the `ProtonConfig`
@@ -300,9 +423,10 @@ pub fn download_proton(version: &str) -> Result<ProtonConfig, ProtonError> {
 ///
 /// Returns an error when prefix or `pfx` directory creation fails.
 pub fn setup_prefix(config: &mut ProtonConfig, prefix_path: &str) -> Result<(), ProtonError> {
-    // Ensure the prefix directory exists
+    // Creating pfx also creates the prefix itself, and create_dir_all already
+    // tolerates directories that exist, so one call covers both.
     debug!("Setting up Proton prefix at {}", prefix_path);
-    create_dir_all(prefix_path)?;
+    create_dir_all(Path::new(prefix_path).join("pfx"))?;
 
     // Update the config with the prefix path
     config.prefix = Some(prefix_path.to_owned());
@@ -316,13 +440,6 @@ pub fn setup_prefix(config: &mut ProtonConfig, prefix_path: &str) -> Result<(),
         prefix_path.to_owned(),
     ));
 
-    // Create pfx directory if it doesn't exist
-    let pfx_dir = format!("{prefix_path}/pfx");
-    if !Path::new(&pfx_dir).exists() {
-        debug!("Creating Proton pfx directory at {}", pfx_dir);
-        create_dir_all(&pfx_dir)?;
-    }
-
     Ok(())
 }
 
@@ -386,27 +503,27 @@ pub fn init_proton_env(config: &mut ProtonConfig) -> Result<(), ProtonError> {
                     .push(("STEAM_CLIENT_LIBRARY_PATH".to_owned(), steam_lib.clone()));
             }
 
-            // Add to library path
-            if library_paths.is_empty() {
-                library_paths.clone_from(steam_lib);
-            } else {
-                library_paths = format!("{library_paths}:{steam_lib}");
+            // Add to library path, appending in place rather than rebuilding the
+            // whole string for every entry.
+            if !library_paths.is_empty() {
+                library_paths.push(':');
             }
+            library_paths.push_str(steam_lib);
         }
     }
 
     // Add library paths to LD_LIBRARY_PATH
     if !library_paths.is_empty() {
-        let current_lib_path = env::var("LD_LIBRARY_PATH").unwrap_or_default();
-        let new_lib_path = if current_lib_path.is_empty() {
-            library_paths
-        } else {
-            format!("{library_paths}:{current_lib_path}")
-        };
+        if let Ok(current_lib_path) = env::var("LD_LIBRARY_PATH")
+            && !current_lib_path.is_empty()
+        {
+            library_paths.push(':');
+            library_paths.push_str(&current_lib_path);
+        }
 
         config
             .env_vars
-            .push(("LD_LIBRARY_PATH".to_owned(), new_lib_path));
+            .push(("LD_LIBRARY_PATH".to_owned(), library_paths));
     }
 
     // Configure optional Proton settings
@@ -429,7 +546,7 @@ pub fn init_proton_env(config: &mut ProtonConfig) -> Result<(), ProtonError> {
 
 #[cfg(test)]
 mod tests {
-    #![allow(clippy::unwrap_used)]
+    #![allow(clippy::unwrap_used, clippy::indexing_slicing)]
 
     use super::*;
     use std::fs;
@@ -594,6 +711,58 @@ mod tests {
         }
     }
 
+    #[test]
+    fn find_proton_falls_back_to_any_install_when_version_is_missing() {
+        let _lock = env_lock()
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner);
+        let temp_home = tempdir().unwrap();
+        let proton_dir = temp_home
+            .path()
+            .join(".steam/steam/compatibilitytools.d/GE-Proton9-1");
+        fs::create_dir_all(&proton_dir).unwrap();
+        let proton_path = proton_dir.join("proton");
+        fs::write(&proton_path, "fake").unwrap();
+
+        unsafe {
+            std::env::set_var("HOME", temp_home.path());
+        }
+
+        let config = find_proton(Some("GE-Proton9-1-missing/")).unwrap();
+        assert_eq!(config.path, proton_path.to_string_lossy());
+        assert_eq!(config.version, "GE-Proton9-1");
+
+        unsafe {
+            std::env::remove_var("HOME");
+        }
+    }
+
+    #[test]
+    fn list_proton_dirs_lists_each_directory_once() {
+        let temp_dir = tempdir().unwrap();
+        let dirs: Vec<String> = ["b", "a", "missing"]
+            .iter()
+            .map(|name| temp_dir.path().join(name).to_string_lossy().into_owned())
+            .collect();
+        for dir in &dirs[..2] {
+            let install = Path::new(dir).join("GE-Proton9-1");
+            fs::create_dir_all(&install).unwrap();
+            fs::write(install.join("proton"), "fake").unwrap();
+        }
+
+        let mut dir_refs: Vec<&str> = dirs.iter().map(String::as_str).collect();
+        dir_refs.push(&dirs[0]);
+        let listings = list_proton_dirs(&dir_refs);
+
+        assert_eq!(listings.len(), 3);
+        assert_eq!(
+            listings[dirs[0].as_str()],
+            vec![Path::new(&dirs[0]).join("GE-Proton9-1/proton")]
+        );
+        assert_eq!(listings[dirs[1].as_str()].len(), 1);
+        assert!(listings[dirs[2].as_str()].is_empty());
+    }
+
     #[test]
     fn create_proton_config_builds_basic_config() {
         let temp_dir = tempdir().unwrap();
@@ -606,4 +775,21 @@ mod tests {
         assert_eq!(config.app_id, "0");
         assert!(config.env_vars.is_empty());
     }
+
+    #[test]
+    fn remove_stale_staging_dirs_only_removes_old_staging_entries() {
+        let temp_dir = tempdir().unwrap();
+        let staging = temp_dir.path().join(format!("{STAGING_PREFIX}abc123"));
+        let install = temp_dir.path().join("GE-Proton9-1");
+        fs::create_dir_all(staging.join("GE-Proton9-1")).unwrap();
+        fs::create_dir_all(&install).unwrap();
+
+        // A recent staging directory may belong to a download in progress.
+        remove_stale_staging_dirs(temp_dir.path(), Duration::from_secs(60 * 60));
+        assert!(staging.exists());
+
+        remove_stale_staging_dirs(temp_dir.path(), Duration::ZERO);
+        assert!(!staging.exists());
+        assert!(install.exists());
+    }
 }
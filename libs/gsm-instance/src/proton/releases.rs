@@ -3,10 +3,14 @@
 //! This module provides functionality for fetching information about Proton GE releases
 //! from the GitHub API. It allows listing all available releases, fetching the latest
 //! release, or fetching a specific release by version tag.
+use super::HTTP_CLIENT;
 use super::types::ProtonRelease;
-use reqwest;
+use reqwest::{self, StatusCode, blocking::Response};
 use serde::Deserialize;
+use std::thread;
+use std::time::Duration;
 use thiserror::Error;
+use tracing::warn;
 
 /// Represents errors that can occur while fetching Proton release information.
 #[derive(Error, Debug)]
@@ -42,6 +46,12 @@ struct GitHubAsset {
 const GITHUB_API_URL: &str =
     "https://api.github.com/repos/GloriousEggroll/proton-ge-custom/releases";
 
+/// How many times a GitHub API request is attempted before giving up.
+const MAX_ATTEMPTS: u32 = 4;
+
+/// Delay before the first retry; each further retry doubles it.
+const RETRY_BASE_DELAY: Duration = Duration::from_millis(500);
+
 /// Fetches a list of all available Proton GE releases from GitHub.
 ///
 /// This function makes a request to the GitHub API to get a list of all releases
@@ -52,40 +62,48 @@ const GITHUB_API_URL: &str =
 ///
 /// Returns an error when the GitHub API request fails or the response cannot be deserialized.
 pub fn list_available_releases() -> Result<Vec<ProtonRelease>, ReleaseError> {
-    let releases: Vec<GitHubRelease> = reqwest::blocking::Client::new()
-        .get(GITHUB_API_URL)
-        .header("User-Agent", "gsm-instance")
-        .send()?
+    let releases: Vec<GitHubRelease> = send_with_retry(GITHUB_API_URL)?
+        .error_for_status()?
         .json()?;
 
     let proton_releases = releases
         .into_iter()
-        .filter_map(|r| {
-            r.assets
-                .iter()
-                .find(|&a| a.name.ends_with(".tar.gz"))
-                .map(|a| ProtonRelease {
-                    tag: r.tag_name.clone(),
-                    download_url: a.browser_download_url.clone(),
-                    release_date: r.published_at.clone(),
-                })
-        })
+        .filter_map(into_proton_release)
         .collect();
 
     Ok(proton_releases)
 }
 
+/// Converts a GitHub release into a `ProtonRelease` if it ships a `.tar.gz` asset.
+fn into_proton_release(release: GitHubRelease) -> Option<ProtonRelease> {
+    let asset = release
+        .assets
+        .into_iter()
+        .find(|a| a.name.ends_with(".tar.gz"))?;
+    Some(ProtonRelease {
+        tag: release.tag_name,
+        download_url: asset.browser_download_url,
+        release_date: release.published_at,
+    })
+}
+
 /// Fetches the latest available Proton GE release from GitHub.
 ///
 /// # Errors
 ///
 /// Returns an error when release metadata cannot be fetched or no release exists.
 pub fn fetch_latest_release() -> Result<ProtonRelease, ReleaseError> {
-    let releases = list_available_releases()?;
-    releases
-        .into_iter()
-        .next()
-        .ok_or_else(|| ReleaseError::NotFound("No releases found".to_owned()))
+    fetch_latest_release_from(GITHUB_API_URL)
+}
+
+/// Fetches the latest release from the releases API at `api_url`.
+fn fetch_latest_release_from(api_url: &str) -> Result<ProtonRelease, ReleaseError> {
+    // GitHub resolves the latest release server-side, so only that one release is
+    // transferred instead of a full page of releases and their assets. Drafts and
+    // prereleases are never reported as latest.
+    fetch_release(&format!("{api_url}/latest"), || {
+        "No releases found".to_owned()
+    })
 }
 
 /// Fetches a specific Proton GE release by its version tag.
@@ -98,17 +116,112 @@ pub fn fetch_latest_release() -> Result<ProtonRelease, ReleaseError> {
 ///
 /// Returns an error when release metadata cannot be fetched or no matching release exists.
 pub fn fetch_specific_release(version: &str) -> Result<ProtonRelease, ReleaseError> {
-    let releases = list_available_releases()?;
-    releases
-        .into_iter()
-        .find(|r| r.tag == version)
-        .ok_or_else(|| ReleaseError::NotFound(format!("Release {version} not found")))
+    fetch_specific_release_from(GITHUB_API_URL, version)
+}
+
+/// Fetches the release tagged `version` from the releases API at `api_url`.
+fn fetch_specific_release_from(
+    api_url: &str,
+    version: &str,
+) -> Result<ProtonRelease, ReleaseError> {
+    let not_found = || format!("Release {version} not found");
+    // The tag becomes a path segment; one that would change the path or start a
+    // query or fragment cannot name a release.
+    if version.is_empty() || version.contains(['/', '?', '#']) {
+        return Err(ReleaseError::NotFound(not_found()));
+    }
+
+    // Ask GitHub for the one tag instead of scanning the release list, which only
+    // covers the most recent page of releases.
+    fetch_release(&format!("{api_url}/tags/{version}"), not_found)
+}
+
+/// Fetches a single release from `url`, reporting a missing release or one without
+/// a `.tar.gz` asset as `NotFound` with the given message.
+fn fetch_release(url: &str, not_found: impl Fn() -> String) -> Result<ProtonRelease, ReleaseError> {
+    let response = send_with_retry(url)?;
+    if response.status() == StatusCode::NOT_FOUND {
+        return Err(ReleaseError::NotFound(not_found()));
+    }
+
+    let release: GitHubRelease = response.error_for_status()?.json()?;
+    into_proton_release(release).ok_or_else(|| ReleaseError::NotFound(not_found()))
+}
+
+/// Sends a GET request to `url`, retrying with exponential backoff when the request
+/// fails to connect, times out, or GitHub answers with a server error.
+///
+/// Rate limit responses (`429`, or `403` with `x-ratelimit-remaining: 0`) are
+/// returned straight away: GitHub's limit resets minutes later, well beyond any
+/// backoff worth waiting for here.
+fn send_with_retry(url: &str) -> Result<Response, reqwest::Error> {
+    let mut attempt = 1;
+    loop {
+        let result = HTTP_CLIENT.get(url).send();
+        let retryable = match &result {
+            Ok(response) => response.status().is_server_error(),
+            Err(err) => err.is_connect() || err.is_timeout(),
+        };
+        if !retryable || attempt >= MAX_ATTEMPTS {
+            return result;
+        }
+
+        let delay = retry_delay(attempt);
+        warn!("Request to {url} failed (attempt {attempt}/{MAX_ATTEMPTS}), retrying in {delay:?}");
+        thread::sleep(delay);
+        attempt += 1;
+    }
+}
+
+/// Returns the backoff before retrying after the given (1-based) attempt.
+fn retry_delay(attempt: u32) -> Duration {
+    RETRY_BASE_DELAY.saturating_mul(1 << attempt.saturating_sub(1).min(16))
 }
 
 #[cfg(test)]
 mod tests {
     #![allow(clippy::unwrap_used)]
     use super::*;
+    use std::io::{BufRead, BufReader, Write};
+    use std::net::TcpListener;
+    use std::sync::mpsc::{self, Receiver};
+
+    const RELEASE_JSON: &str = r#"{
+        "tag_name": "GE-Proton9-1",
+        "published_at": "2024-01-01T00:00:00Z",
+        "assets": [{
+            "browser_download_url": "https://example.com/GE-Proton9-1.tar.gz",
+            "name": "GE-Proton9-1.tar.gz"
+        }]
+    }"#;
+
+    /// Answers a single request on a local port with `status` and `body`. Returns
+    /// the releases API URL to query and a receiver for the requested path.
+    fn serve_once(status: &'static str, body: &'static str) -> (String, Receiver<String>) {
+        let listener = TcpListener::bind("127.0.0.1:0").unwrap();
+        let api_url = format!("http://{}/releases", listener.local_addr().unwrap());
+        let (path_tx, path_rx) = mpsc::channel();
+        thread::spawn(move || {
+            let (mut stream, _) = listener.accept().unwrap();
+            let mut reader = BufReader::new(stream.try_clone().unwrap());
+            let mut request_line = String::new();
+            reader.read_line(&mut request_line).unwrap();
+            let mut header = String::new();
+            while reader.read_line(&mut header).unwrap() > 2 {
+                header.clear();
+            }
+            let path = request_line.split_whitespace().nth(1).unwrap_or_default();
+            path_tx.send(path.to_owned()).unwrap();
+            write!(
+                stream,
+                "HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\
+                 Content-Length: {}\r\nConnection: close\r\n\r\n{body}",
+                body.len()
+            )
+            .unwrap();
+        });
+        (api_url, path_rx)
+    }
 
     #[test]
     fn release_error_not_found_displays_correctly() {
@@ -124,27 +237,93 @@ mod tests {
     }
 
     #[test]
-    fn fetch_latest_release_returns_not_found_on_empty_list() {
-        let releases: Vec<ProtonRelease> = vec![];
-        let result = releases
-            .into_iter()
-            .next()
-            .ok_or_else(|| ReleaseError::NotFound("No releases found".to_owned()));
-        assert!(matches!(result, Err(ReleaseError::NotFound(_))));
+    fn fetch_latest_release_requests_the_latest_endpoint() {
+        let (api_url, requested) = serve_once("200 OK", RELEASE_JSON);
+        let release = fetch_latest_release_from(&api_url).unwrap();
+        assert_eq!(release.tag, "GE-Proton9-1");
+        assert_eq!(requested.recv().unwrap(), "/releases/latest");
+    }
+
+    #[test]
+    fn fetch_latest_release_returns_not_found_without_releases() {
+        let (api_url, _requested) = serve_once("404 Not Found", r#"{"message":"Not Found"}"#);
+        let result = fetch_latest_release_from(&api_url);
+        assert!(matches!(
+            result,
+            Err(ReleaseError::NotFound(message)) if message == "No releases found"
+        ));
+    }
+
+    #[test]
+    fn retry_delay_doubles_each_attempt() {
+        assert_eq!(retry_delay(1), RETRY_BASE_DELAY);
+        assert_eq!(retry_delay(2), RETRY_BASE_DELAY * 2);
+        assert_eq!(retry_delay(3), RETRY_BASE_DELAY * 4);
+    }
+
+    #[test]
+    fn into_proton_release_uses_tarball_asset() {
+        let release = GitHubRelease {
+            tag_name: "GE-Proton9-1".to_owned(),
+            published_at: "2024-01-01T00:00:00Z".to_owned(),
+            assets: vec![
+                GitHubAsset {
+                    browser_download_url: "https://example.com/GE-Proton9-1.sha512sum".to_owned(),
+                    name: "GE-Proton9-1.sha512sum".to_owned(),
+                },
+                GitHubAsset {
+                    browser_download_url: "https://example.com/GE-Proton9-1.tar.gz".to_owned(),
+                    name: "GE-Proton9-1.tar.gz".to_owned(),
+                },
+            ],
+        };
+
+        let proton = into_proton_release(release).unwrap();
+        assert_eq!(proton.tag, "GE-Proton9-1");
+        assert_eq!(
+            proton.download_url,
+            "https://example.com/GE-Proton9-1.tar.gz"
+        );
+    }
+
+    #[test]
+    fn into_proton_release_skips_releases_without_tarball() {
+        let release = GitHubRelease {
+            tag_name: "GE-Proton9-1".to_owned(),
+            published_at: "2024-01-01T00:00:00Z".to_owned(),
+            assets: Vec::new(),
+        };
+        assert!(into_proton_release(release).is_none());
+    }
+
+    #[test]
+    fn fetch_specific_release_requests_the_tag() {
+        let (api_url, requested) = serve_once("200 OK", RELEASE_JSON);
+        let release = fetch_specific_release_from(&api_url, "GE-Proton9-1").unwrap();
+        assert_eq!(release.tag, "GE-Proton9-1");
+        assert_eq!(requested.recv().unwrap(), "/releases/tags/GE-Proton9-1");
     }
 
     #[test]
     fn fetch_specific_release_returns_not_found_for_missing_version() {
-        let releases: Vec<ProtonRelease> = vec![ProtonRelease {
-            tag: "GE-Proton8-1".to_owned(),
-            download_url: "https://example.com/proton.tar.gz".to_owned(),
-            release_date: "2024-01-01T00:00:00Z".to_owned(),
-        }];
-        let version = "GE-Proton9-99";
-        let result = releases
-            .into_iter()
-            .find(|r| r.tag == version)
-            .ok_or_else(|| ReleaseError::NotFound(format!("Release {version} not found")));
-        assert!(matches!(result, Err(ReleaseError::NotFound(_))));
+        let (api_url, requested) = serve_once("404 Not Found", r#"{"message":"Not Found"}"#);
+        let result = fetch_specific_release_from(&api_url, "GE-Proton9-99");
+        assert!(matches!(
+            result,
+            Err(ReleaseError::NotFound(message)) if message == "Release GE-Proton9-99 not found"
+        ));
+        assert_eq!(requested.recv().unwrap(), "/releases/tags/GE-Proton9-99");
+    }
+
+    #[test]
+    fn fetch_specific_release_rejects_tags_that_change_the_url() {
+        // Nothing listens on the discard port; rejected tags never reach it.
+        for version in ["", "../latest", "GE-Proton9-1?per_page=1", "GE-Proton9-1#x"] {
+            let result = fetch_specific_release_from("http://127.0.0.1:9/releases", version);
+            assert!(
+                matches!(result, Err(ReleaseError::NotFound(_))),
+                "{version}"
+            );
+        }
     }
 }
@@ -8,43 +8,15 @@ use crate::config::InstanceConfig;
 use crate::errors::InstanceError;
 use crate::launcher::launch_server;
 use std::fs;
-use std::fs::create_dir_all;
-use std::path::Path;
 use std::process::Child;
 use std::thread;
 use std::time::Duration;
 use tracing::info;
 
-/// Ensures the log directory exists under the given working directory.
-///
-/// This helper function creates the `logs` subdirectory within the specified
-/// `working_dir` if it doesn't already exist. This is where the server's
-/// standard output and error streams will be redirected.
-///
-/// # Arguments
-///
-/// * `working_dir`: The root working directory of the game server instance.
-///
-/// # Returns
-///
-/// Returns `Ok(())` on success, or an `InstanceError::IoError` if the directory
-/// cannot be created.
-fn ensure_log_dir(working_dir: &Path) -> Result<(), InstanceError> {
-    let logs_dir = working_dir.join("logs");
-    create_dir_all(&logs_dir)?;
-    Ok(())
-}
-
-/// Exposed for testing only.
-#[cfg(test)]
-pub(crate) fn ensure_log_dir_test(working_dir: &Path) -> Result<(), InstanceError> {
-    ensure_log_dir(working_dir)
-}
-
 /// Starts the game server as a daemonized process.
 ///
-/// This function orchestrates the launch of the game server. It first prepares
-/// the logging environment, then uses the `launcher` module to construct the
+/// This function orchestrates the launch of the game server. It uses the
+/// `launcher` module to prepare the logging environment and construct the
 /// appropriate command. The server process is then spawned, its PID is recorded
 /// in a file, and the function waits briefly to catch immediate startup failures.
 ///
@@ -59,8 +31,8 @@ pub(crate) fn ensure_log_dir_test(working_dir: &Path) -> Result<(), InstanceErro
 ///
 /// # Behavior
 ///
-/// - Creates a `logs` directory within the `working_dir` if it doesn't exist.
-/// - Constructs the launch command using `launcher::launch_server`.
+/// - Constructs the launch command using `launcher::launch_server`, which also creates
+///   the `logs` directory within the `working_dir` if it doesn't exist.
 /// - Spawns the server process in the background.
 /// - Writes the process ID (PID) of the spawned server to an `instance.pid` file
 ///   within the `working_dir`. This PID file is crucial for managing the server's
@@ -77,20 +49,16 @@ pub(crate) fn ensure_log_dir_test(working_dir: &Path) -> Result<(), InstanceErro
 /// startup validation fails.
 pub fn start_daemonized(config: &InstanceConfig) -> Result<Child, InstanceError> {
     info!("Starting server as a daemonized process...");
-    let working_dir = config.working_dir.clone();
-    ensure_log_dir(&working_dir)?;
 
     match launch_server(config) {
         Ok(mut cmd) => match cmd.spawn() {
             Ok(mut child) => {
                 let pid = child.id();
-                let pid_file = working_dir.join("instance.pid");
+                let pid_file = config.pid_file();
 
-                if pid_file.exists() {
-                    fs::remove_file(&pid_file)?;
-                }
-
-                fs::write(pid_file, pid.to_string())?;
+                // `fs::write` truncates any stale pid file, so there is no need to
+                // stat and unlink it first.
+                fs::write(&pid_file, pid.to_string())?;
 
                 // Surface immediate startup failures so callers do not assume
                 // a zombie/failed process is a healthy server start.
@@ -101,7 +69,7 @@ pub fn start_daemonized(config: &InstanceConfig) -> Result<Child, InstanceError>
                     .try_wait()
                     .map_err(|e| InstanceError::CommandExecutionError(e.to_string()))?
                 {
-                    let _ = fs::remove_file(working_dir.join("instance.pid"));
+                    let _ = fs::remove_file(&pid_file);
                     return Err(InstanceError::CommandExecutionError(format!(
                         "Server process exited immediately with status {status}"
                     )));
@@ -124,23 +92,6 @@ mod tests {
     use std::fs;
     use tempfile::tempdir;
 
-    #[test]
-    fn ensure_log_dir_creates_logs_subdirectory() {
-        let temp = tempdir().unwrap();
-        ensure_log_dir_test(temp.path()).unwrap();
-        assert!(temp.path().join("logs").is_dir());
-    }
-
-    #[test]
-    fn ensure_log_dir_fails_when_path_is_a_file() {
-        let temp = tempdir().unwrap();
-        let blocking = temp.path().join("logs");
-        fs::write(&blocking, "block").unwrap();
-
-        let result = ensure_log_dir_test(temp.path());
-        assert!(result.is_err());
-    }
-
     #[test]
     fn start_daemonized_errors_when_log_dir_cannot_be_created() {
         let temp = tempdir().unwrap();
@@ -29,10 +29,17 @@
 use crate::errors::InstanceError;
 use crate::steamcmd::steamcmd_command;
 use regex::Regex;
-use std::fs;
+use std::fs::File;
+use std::io::{BufRead, BufReader};
 use std::path::Path;
+use std::process::Stdio;
+use std::sync::LazyLock;
 use tracing::{debug, info};
 
+#[allow(clippy::expect_used)]
+static BUILD_ID_RE: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r#""buildid"\s+"(\d+)""#).expect("build id regex should compile"));
+
 /// Struct holding build ID information.
 #[derive(Debug, PartialEq, Eq)]
 pub struct UpdateInfo {
@@ -47,13 +54,8 @@ impl UpdateInfo {
     ///
     /// Returns an error when either file cannot be read.
     pub fn new(manifest_path: &Path, appinfo_path: &Path) -> Result<Self, InstanceError> {
-        let manifest_data = fs::read_to_string(manifest_path)
-            .map_err(|e| InstanceError::CommandExecutionError(e.to_string()))?;
-        let current_build_id = extract_build_id_from_manifest(&manifest_data).to_owned();
-
-        let appinfo_data = fs::read_to_string(appinfo_path)
-            .map_err(|e| InstanceError::CommandExecutionError(e.to_string()))?;
-        let latest_build_id = extract_build_id_from_app_info(&appinfo_data).to_owned();
+        let current_build_id = read_build_id(manifest_path)?;
+        let latest_build_id = read_build_id(appinfo_path)?;
 
         Ok(Self {
             current_build_id,
@@ -67,26 +69,33 @@ impl UpdateInfo {
     }
 }
 
-/// Extracts the build ID from the manifest file contents using regex.
-///
-/// Expected format: `"buildid"    "123456"`.
-fn extract_build_id_from_manifest(manifest: &str) -> &str {
-    let Ok(re) = Regex::new(r#""buildid"\s+"(\d+)""#) else {
-        return "";
-    };
-    re.captures(manifest)
-        .and_then(|caps| caps.get(1).map(|m| m.as_str()))
-        .unwrap_or("")
+/// Reads `path` line by line until a build ID is found, so the remainder of a
+/// large file is never read. Returns an empty string if no line contains one.
+fn read_build_id(path: &Path) -> Result<String, InstanceError> {
+    let file = File::open(path).map_err(|e| InstanceError::CommandExecutionError(e.to_string()))?;
+    let mut reader = BufReader::new(file);
+    let mut line = String::new();
+    loop {
+        line.clear();
+        let read = reader
+            .read_line(&mut line)
+            .map_err(|e| InstanceError::CommandExecutionError(e.to_string()))?;
+        if read == 0 {
+            return Ok(String::new());
+        }
+        let build_id = extract_build_id(&line);
+        if !build_id.is_empty() {
+            return Ok(build_id.to_owned());
+        }
+    }
 }
 
-/// Extracts the build ID from the appinfo file contents using regex.
+/// Extracts the build ID from manifest or appinfo contents using regex.
 ///
-/// Expected format (simplified): `"buildid"    "123456"`.
-fn extract_build_id_from_app_info(app_info: &str) -> &str {
-    let Ok(re) = Regex::new(r#""buildid"\s+"(\d+)""#) else {
-        return "";
-    };
-    re.captures(app_info)
+/// Both files use the same format: `"buildid"    "123456"`.
+fn extract_build_id(contents: &str) -> &str {
+    BUILD_ID_RE
+        .captures(contents)
         .and_then(|caps| caps.get(1).map(|m| m.as_str()))
         .unwrap_or("")
 }
@@ -140,12 +149,14 @@ pub fn update_server<P: AsRef<Path>>(
     let login = "+login anonymous".to_owned();
     let force_install_dir = format!("+force_install_dir {}", install_dir.as_ref().display());
     let app_update = format!("+app_update {app_id} validate");
-    let mut args = vec![force_install_dir, login, app_update];
-
+    // Build the list front to back, sized for every argument, rather than
+    // shifting the base arguments when the platform override is prepended.
+    let mut args = Vec::with_capacity(extra_args.len() + 5);
     if force_windows {
         let platform = "windows";
-        args.insert(0, format!("+@sSteamCmdForcePlatformType {platform}"));
+        args.push(format!("+@sSteamCmdForcePlatformType {platform}"));
     }
+    args.extend([force_install_dir, login, app_update]);
 
     args.extend_from_slice(extra_args);
     args.push(String::from("+quit"));
@@ -153,16 +164,19 @@ pub fn update_server<P: AsRef<Path>>(
     let mut steamcmd = steamcmd_command();
     let command = steamcmd.args(&args);
     debug!("Executing update command: {:?}", command);
-    let output = command
-        .output()
+    // Only the exit status is used, so discard SteamCMD's progress output instead of
+    // buffering all of it in memory until the update finishes.
+    let status = command
+        .stdout(Stdio::null())
+        .stderr(Stdio::null())
+        .status()
         .map_err(|e| InstanceError::CommandExecutionError(e.to_string()))?;
-    if output.status.success() {
+    if status.success() {
         info!("Update successful.");
         Ok(())
     } else {
         Err(InstanceError::CommandExecutionError(format!(
-            "Update failed with status: {:?}",
-            output.status
+            "Update failed with status: {status:?}"
         )))
     }
 }
@@ -208,26 +222,31 @@ mod tests {
 
     #[test]
     fn test_extract_build_id_from_manifest() {
-        let build_id = extract_build_id_from_manifest(SAMPLE_MANIFEST);
-        assert_eq!(build_id, "1000");
+        assert_eq!(extract_build_id(SAMPLE_MANIFEST), "1000");
     }
 
     #[test]
     fn test_extract_build_id_from_app_info() {
-        let build_id = extract_build_id_from_app_info(SAMPLE_APPINFO);
-        assert_eq!(build_id, "1001");
+        assert_eq!(extract_build_id(SAMPLE_APPINFO), "1001");
     }
 
     #[test]
-    fn test_extract_build_id_from_manifest_returns_empty_when_missing() {
-        let build_id = extract_build_id_from_manifest("\"AppState\" {}\n");
-        assert_eq!(build_id, "");
+    fn test_extract_build_id_returns_empty_when_missing() {
+        assert_eq!(extract_build_id("\"AppState\" {}\n"), "");
+        assert_eq!(extract_build_id("\"appinfo\" {}\n"), "");
     }
 
     #[test]
-    fn test_extract_build_id_from_app_info_returns_empty_when_missing() {
-        let build_id = extract_build_id_from_app_info("\"appinfo\" {}\n");
-        assert_eq!(build_id, "");
+    fn test_read_build_id_stops_at_first_match() {
+        let temp_dir = tempdir().unwrap();
+        let appinfo_path = temp_dir.path().join("appinfo.vdf");
+        // Bytes after the build ID are never read, so they need not be valid UTF-8.
+        let mut contents = SAMPLE_APPINFO.as_bytes().to_vec();
+        contents.extend_from_slice(&[0xff, 0xfe, b'\n']);
+        fs::write(&appinfo_path, contents).unwrap();
+
+        let build_id = read_build_id(&appinfo_path).unwrap();
+        assert_eq!(build_id, "1001");
     }
 
     #[test]
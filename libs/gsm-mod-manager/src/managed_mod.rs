@@ -8,14 +8,20 @@ use crate::parse_mod_string::parse_mod_string;
 use fs_extra::dir;
 use fs_extra::dir::CopyOptions;
 use reqwest::Url;
+use reqwest::blocking::Client;
 use std::convert::TryFrom;
 use std::fs::{File, create_dir_all};
-use std::path::{Path, PathBuf};
-use tempfile::tempdir;
+use std::io::{Read, Seek};
+use std::path::PathBuf;
+use std::sync::LazyLock;
+use tempfile::{NamedTempFile, tempdir};
 use tracing::{debug, error};
-use walkdir::WalkDir;
 use zip::ZipArchive;
 
+/// HTTP client shared by every mod download, so fetching several mods reuses
+/// pooled connections to the same hosts.
+static HTTP_CLIENT: LazyLock<Client> = LazyLock::new(Client::new);
+
 pub struct ManagedMod {
     pub(crate) url: String,
     pub(crate) file_type: String,
@@ -40,16 +46,19 @@ impl ManagedMod {
         }
     }
 
-    /// Checks if the extracted mod is a BepInEx framework mod.
-    fn is_bepinex(extract_path: &Path) -> bool {
+    /// Checks if the mod archive is a BepInEx framework mod.
+    ///
+    /// Reads entry names from the archive's central directory, which is already in
+    /// memory, instead of walking the extracted tree on disk.
+    fn is_bepinex<R: Read + Seek>(archive: &ZipArchive<R>) -> bool {
         debug!("Checking if mod is BepInEx framework...");
-        for entry in WalkDir::new(extract_path).into_iter().flatten() {
-            let file_name = entry.file_name().to_string_lossy().to_lowercase();
-            if file_name == "winhttp.dll" || file_name == "bepinex" {
-                return true;
-            }
-        }
-        false
+        // Archives built on Windows may separate components with backslashes.
+        archive.file_names().any(|name| {
+            name.split(['/', '\\']).any(|component| {
+                component.eq_ignore_ascii_case("winhttp.dll")
+                    || component.eq_ignore_ascii_case("bepinex")
+            })
+        })
     }
 
     /// Downloads the configured mod archive into the staging location.
@@ -66,28 +75,37 @@ impl ManagedMod {
         }
 
         let parsed_url = Url::parse(&self.url).map_err(|_| ModError::InvalidUrl)?;
-        let mut response = reqwest::blocking::get(parsed_url)
+        let mut response = HTTP_CLIENT
+            .get(parsed_url.clone())
+            .send()
             .map_err(|e| ModError::DownloadError(e.to_string()))?;
 
-        if !SUPPORTED_FILE_TYPES.contains(&self.file_type.as_str()) {
+        // Keep whichever URL is already parsed rather than parsing `self.url` again.
+        let final_url = if SUPPORTED_FILE_TYPES.contains(&self.file_type.as_str()) {
+            parsed_url
+        } else {
             debug!("Updating redirect URL: {}", &self.url);
-            self.url = response.url().to_string();
-            self.file_type = url_parse_file_type(response.url().as_ref());
-        }
-
-        let final_url = Url::parse(&self.url).map_err(|_| ModError::InvalidUrl)?;
+            let redirect_url = response.url().clone();
+            self.url = redirect_url.to_string();
+            self.file_type = url_parse_file_type(redirect_url.as_str());
+            redirect_url
+        };
         let file_name = parse_file_name(
             &final_url,
             &format!("{}.{}", get_md5_hash(&self.url), self.file_type),
         );
+        // Stream into a temporary file next to the destination and rename it into
+        // place, so an interrupted download never leaves a truncated archive behind.
+        let mut file = NamedTempFile::new_in(&self.staging_location)
+            .map_err(|e| ModError::FileCreateError(e.to_string()))?;
         self.staging_location = self.staging_location.join(file_name);
         debug!("Downloading to: {:?}", self.staging_location);
 
-        let mut file = File::create(&self.staging_location)
-            .map_err(|e| ModError::FileCreateError(e.to_string()))?;
         response
             .copy_to(&mut file)
             .map_err(|e| ModError::DownloadError(e.to_string()))?;
+        file.persist(&self.staging_location)
+            .map_err(|e| ModError::FileCreateError(e.to_string()))?;
         self.downloaded = true;
         debug!("Download complete: {}", &self.url);
         Ok(())
@@ -108,19 +126,20 @@ impl ManagedMod {
         let temp_dir = tempdir().map_err(|e| ModError::TempDirCreationError(e.to_string()))?;
         debug!("Created temp directory: {:?}", temp_dir.path());
 
-        {
+        let is_bepinex = {
             let zip_file = File::open(&self.staging_location)
                 .map_err(|e| ModError::FileOpenError(e.to_string()))?;
             let mut archive =
                 ZipArchive::new(zip_file).map_err(|e| ModError::ZipArchiveError(e.to_string()))?;
+            let is_bepinex = Self::is_bepinex(&archive);
             archive
                 .extract(temp_dir.path())
                 .map_err(|e| ModError::ExtractionError(e.to_string()))?;
             normalize_paths(temp_dir.path())
                 .map_err(|e| ModError::ExtractionError(e.to_string()))?;
-        }
+            is_bepinex
+        };
 
-        let is_bepinex = Self::is_bepinex(temp_dir.path());
         let final_dir = if is_bepinex {
             &self.game_directory
         } else {
@@ -266,6 +285,21 @@ mod tests {
         assert!(found, "winhttp.dll not found in game directory");
     }
 
+    #[test]
+    fn test_is_bepinex_checks_nested_entry_names() {
+        let archive_with = |name: &str| {
+            let mut zip = ZipWriter::new(std::io::Cursor::new(Vec::new()));
+            zip.start_file(name, FileOptions::<()>::default()).unwrap();
+            ZipArchive::new(zip.finish().unwrap()).unwrap()
+        };
+
+        assert!(ManagedMod::is_bepinex(&archive_with(
+            "BepInExPack\\BepInEx\\core\\BepInEx.dll"
+        )));
+        assert!(ManagedMod::is_bepinex(&archive_with("pack/WinHTTP.dll")));
+        assert!(!ManagedMod::is_bepinex(&archive_with("plugins/MyMod.dll")));
+    }
+
     #[test]
     fn test_try_from_valid_url() {
         let mod_instance = ManagedMod::try_from("http://example.com/mod.zip".to_owned()).unwrap();
@@ -1,13 +1,10 @@
-use regex::Regex;
-use std::sync::LazyLock;
-
-#[allow(clippy::expect_used)]
-static MOD_STRING_RE: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"^([^-\s]+)-([^-]+)-([\d\.]+)$").expect("mod string regex should compile")
-});
-
 /// Parses a mod string into its author, mod name, and version components.
 ///
+/// A mod string has the form `Author-ModName-1.2.3`: exactly three non-empty
+/// parts separated by `-`, where the author has no whitespace and the version is
+/// made of digits and dots. The parts are split by hand rather than with a regex,
+/// since the format is fixed and never needs backtracking.
+///
 /// # Arguments
 ///
 /// * `mod_string` - A string slice that holds the mod string to be parsed.
@@ -16,17 +13,18 @@ static MOD_STRING_RE: LazyLock<Regex> = LazyLock::new(|| {
 ///
 /// An `Option` containing a tuple with the author, mod name, and version if parsing is successful; `None` otherwise.
 pub fn parse_mod_string(mod_string: &str) -> Option<(&str, &str, &str)> {
-    MOD_STRING_RE.captures(mod_string).and_then(|caps| {
-        if caps.len() == 4 {
-            Some((
-                caps.get(1)?.as_str(),
-                caps.get(2)?.as_str(),
-                caps.get(3)?.as_str(),
-            ))
-        } else {
-            None
-        }
-    })
+    let mut parts = mod_string.split('-');
+    let (author, mod_name, version) = (parts.next()?, parts.next()?, parts.next()?);
+    if parts.next().is_some() {
+        return None;
+    }
+
+    let valid = !author.is_empty()
+        && !author.contains(char::is_whitespace)
+        && !mod_name.is_empty()
+        && !version.is_empty()
+        && version.chars().all(|c| c.is_ascii_digit() || c == '.');
+    valid.then_some((author, mod_name, version))
 }
 
 #[cfg(test)]
@@ -68,6 +66,28 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_rejects_malformed_parts() {
+        let mod_strings = [
+            "Author Name-Mod-1.0.0",
+            "Author-Mod-1.0.0-beta",
+            "Author-Mod-1.0a",
+            "Author--1.0.0",
+            "Author-Mod-1.0.0\n",
+        ];
+
+        for mod_str in &mod_strings {
+            assert!(
+                parse_mod_string(mod_str).is_none(),
+                "Parsed invalid mod string: {mod_str:?}"
+            );
+        }
+        assert_eq!(
+            parse_mod_string("Author-Mod Name-1.0.0"),
+            Some(("Author", "Mod Name", "1.0.0"))
+        );
+    }
+
     #[test]
     fn test_parse_components() {
         let mod_str = "denikson-BepInExPack_Valheim-5.4.2202";
@@ -3,9 +3,8 @@
 //! The monitor continuously reads from a log file and processes each new line using the log rules
 //! defined in the `rules` module. It also detects if the file has been truncated or rotated and reopens it accordingly.
 
-use crate::LogRule;
 use crate::constants::INSTANCE_TARGET;
-use crate::rules::LogRules;
+use crate::rules::{LogRule, LogRules};
 use std::fs::File;
 use std::io::{BufRead, BufReader, Seek, SeekFrom};
 use std::path::{Path, PathBuf};
@@ -26,18 +25,10 @@ impl Monitor {
         Self { rules }
     }
 
-    fn process_rules(&self, line: &str) {
+    /// Runs the actions of the matching rules, which are already ordered by ranking.
+    fn apply_rules(rules: &[LogRule], line: &str) {
         trace!("Processing rules for line: {line}");
-        let mut rules = self.rules.get_rules();
-
-        trace!("Sorting rules by ranking");
-        rules.sort_by_key(|rule| rule.ranking);
-
-        let filtered_rules: Vec<&LogRule> =
-            rules.iter().filter(|rule| (rule.matcher)(line)).collect();
-
-        trace!("Filtered rules count: {}", filtered_rules.len());
-        for rule in filtered_rules {
+        for rule in rules.iter().filter(|rule| (rule.matcher)(line)) {
             trace!("Applying rule action for line");
             (rule.action)(line);
 
@@ -64,10 +55,17 @@ impl Monitor {
             return;
         }
 
+        // One line buffer is reused for the life of the tail instead of allocating per line.
+        let mut line = String::new();
+        // A burst of lines is matched against one rules snapshot, taken at its first line
+        // and released once the reader catches up, so rules added meanwhile apply to the
+        // next burst.
+        let mut rules = None;
         loop {
-            let mut line = String::new();
+            line.clear();
             match reader.read_line(&mut line) {
                 Ok(0) => {
+                    rules = None;
                     if let Ok(metadata) = reader.get_ref().metadata()
                         && let Ok(current_pos) = reader.stream_position()
                         && metadata.len() < current_pos
@@ -93,7 +91,8 @@ impl Monitor {
                 }
                 Ok(_) => {
                     trace!("Read line from file: {line}");
-                    self.process_rules(line.trim_end());
+                    let rules = rules.get_or_insert_with(|| self.rules.snapshot());
+                    Self::apply_rules(rules, line.trim_end());
                 }
                 Err(e) => {
                     error!("Error reading from {}: {}", path.display(), e);
@@ -197,6 +196,36 @@ mod tests {
         drop(handle); // thread runs forever; let it be reaped by the process
     }
 
+    #[test]
+    fn run_applies_rules_added_after_monitor_starts() {
+        let temp = tempdir().unwrap();
+        let log_path = temp.path().join("server.log");
+        fs::write(&log_path, "").unwrap();
+
+        let rules = LogRules::new();
+        let monitor = Monitor::new(rules.clone());
+        let path = log_path.clone();
+        let handle = thread::spawn(move || monitor.run(&path));
+        thread::sleep(Duration::from_millis(50));
+
+        let hit = Arc::new(AtomicBool::new(false));
+        let hit_clone = Arc::clone(&hit);
+        rules.add_rule(
+            |line| line.contains("LATE"),
+            move |_| {
+                hit_clone.store(true, Ordering::SeqCst);
+            },
+            true,
+            None,
+        );
+
+        fs::write(&log_path, "LATE rule line\n").unwrap();
+        thread::sleep(Duration::from_millis(300));
+
+        assert!(hit.load(Ordering::SeqCst), "late rule should have fired");
+        drop(handle);
+    }
+
     #[test]
     fn start_monitor_in_thread_does_not_panic_for_missing_file() {
         let temp = tempdir().unwrap();
@@ -215,7 +244,7 @@ mod tests {
     }
 
     #[test]
-    fn process_rules_applies_matching_rules_in_ranking_order() {
+    fn apply_rules_applies_matching_rules_in_ranking_order() {
         let hits = Arc::new(AtomicUsize::new(0));
         let rules = LogRules::new();
 
@@ -243,13 +272,12 @@ mod tests {
             );
         }
 
-        let monitor = Monitor::new(rules);
-        monitor.process_rules("match this line");
+        Monitor::apply_rules(&rules.snapshot(), "match this line");
         assert_eq!(hits.load(Ordering::SeqCst), 11);
     }
 
     #[test]
-    fn process_rules_stops_after_first_stop_rule() {
+    fn apply_rules_stops_after_first_stop_rule() {
         let hits = Arc::new(AtomicUsize::new(0));
         let rules = LogRules::new();
 
@@ -277,8 +305,7 @@ mod tests {
             );
         }
 
-        let monitor = Monitor::new(rules);
-        monitor.process_rules("any line");
+        Monitor::apply_rules(&rules.snapshot(), "any line");
         assert_eq!(hits.load(Ordering::SeqCst), 1);
     }
 }
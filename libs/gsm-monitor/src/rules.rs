@@ -53,16 +53,20 @@ impl LogRule {
     }
 }
 
+/// A shared, ranking-ordered set of log rules.
+///
+/// The rules live behind a copy-on-write snapshot: adding a rule publishes a new
+/// list, while readers just take another reference to the current one.
 #[derive(Clone)]
 pub struct LogRules {
-    rules: Arc<RwLock<Vec<LogRule>>>,
+    rules: Arc<RwLock<Arc<[LogRule]>>>,
 }
 
 impl LogRules {
     pub fn new() -> Self {
         trace!("Initializing LogRules");
         Self {
-            rules: Arc::new(RwLock::new(vec![LogRule::default()])),
+            rules: Arc::new(RwLock::new(Arc::from([LogRule::default()]))),
         }
     }
 
@@ -72,25 +76,31 @@ impl LogRules {
         G: Fn(&str) + Send + Sync + 'static,
     {
         trace!("Adding new rule with stop flag: {stop}");
-        let mut rules = self.rules.write().unwrap_or_else(PoisonError::into_inner);
         let mut rule = LogRule::new();
         rule.stop = stop;
         rule.matcher = Arc::new(matcher);
         rule.action = Arc::new(action);
+
+        let mut guard = self.rules.write().unwrap_or_else(PoisonError::into_inner);
+        let mut rules = guard.to_vec();
         rule.ranking = ranking.unwrap_or_else(|| default_ranking(rules.len()));
-        rules.push(rule);
+        // Keep the list ordered by ranking as it is built so readers never have to sort.
+        // Inserting after every rule of equal ranking matches a stable sort.
+        let index = rules.partition_point(|r| r.ranking <= rule.ranking);
+        rules.insert(index, rule);
+        *guard = Arc::from(rules);
     }
 
+    /// Returns the rules ordered by ranking.
     pub fn get_rules(&self) -> Vec<LogRule> {
-        trace!("Retrieving and sorting rules");
-        let mut rules = self
-            .rules
-            .read()
-            .unwrap_or_else(PoisonError::into_inner)
-            .clone();
-        rules.sort_by_key(|r| r.ranking);
-        trace!("Sorted rules count: {}", rules.len());
-        rules
+        trace!("Retrieving rules");
+        self.snapshot().to_vec()
+    }
+
+    /// Returns a shared handle to the current rules, ordered by ranking, without
+    /// copying them.
+    pub fn snapshot(&self) -> Arc<[LogRule]> {
+        Arc::clone(&self.rules.read().unwrap_or_else(PoisonError::into_inner))
     }
 }
 
@@ -140,6 +150,31 @@ mod tests {
         assert_eq!(rankings, vec![5, 20, DEFAULT_STOP_INT]);
     }
 
+    #[test]
+    fn snapshot_is_unaffected_by_later_rules() {
+        let rules = LogRules::new();
+        let before = rules.snapshot();
+        rules.add_rule(|_| true, |_| {}, false, Some(1));
+
+        assert_eq!(before.len(), 1);
+        assert_eq!(rules.snapshot().len(), 2);
+    }
+
+    #[test]
+    fn rules_with_equal_ranking_keep_insertion_order() {
+        let rules = LogRules::new();
+        rules.add_rule(|_| true, |_| {}, true, Some(7));
+        rules.add_rule(|_| true, |_| {}, false, Some(7));
+
+        let stops: Vec<bool> = rules
+            .get_rules()
+            .into_iter()
+            .filter(|rule| rule.ranking == 7)
+            .map(|rule| rule.stop)
+            .collect();
+        assert_eq!(stops, vec![true, false]);
+    }
+
     #[test]
     fn default_rules_include_warning_and_error_handlers() {
         let rules = LogRules::default();
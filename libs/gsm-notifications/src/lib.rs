@@ -25,6 +25,11 @@ use reqwest::blocking::Client;
 use serde::Serialize;
 use std::error::Error;
 use std::fmt;
+use std::sync::LazyLock;
+
+/// HTTP client shared by every dispatcher, so consecutive notifications reuse
+/// pooled keep-alive connections instead of opening a new one each time.
+static HTTP_CLIENT: LazyLock<Client> = LazyLock::new(Client::new);
 
 /// Custom error type for notifications.
 #[derive(Debug)]
@@ -80,7 +85,6 @@ fn validate_webhook_url(webhook_url: &str) -> Result<(), NotificationError> {
 }
 
 /// Returns true if the URL appears to be a Discord webhook.
-#[allow(dead_code)]
 fn is_discord_webhook(webhook_url: &str) -> bool {
     webhook_url.starts_with("https://discord.com/api/webhooks")
         || webhook_url.starts_with("https://discordapp.com/api/webhooks")
@@ -144,8 +148,7 @@ impl NotificationDispatcher for GenericDispatcher {
             message: message.to_owned(),
             data,
         };
-        let client = Client::new();
-        let response = client.post(webhook_url).json(&payload).send()?;
+        let response = HTTP_CLIENT.post(webhook_url).json(&payload).send()?;
         response.error_for_status()?;
         Ok(())
     }
@@ -170,8 +173,7 @@ impl NotificationDispatcher for DiscordDispatcher {
                 color: get_discord_color(notification_type),
             }],
         };
-        let client = Client::new();
-        let response = client.post(webhook_url).json(&payload).send()?;
+        let response = HTTP_CLIENT.post(webhook_url).json(&payload).send()?;
         response.error_for_status()?;
         Ok(())
     }
@@ -212,18 +214,15 @@ impl DispatcherRegistry {
 /// Constructs a default dispatcher registry with Discord and generic dispatchers.
 fn default_registry() -> DispatcherRegistry {
     let mut registry = DispatcherRegistry::new();
-    registry.register(
-        |url| {
-            url.starts_with("https://discord.com/api/webhooks")
-                || url.starts_with("https://discordapp.com/api/webhooks")
-        },
-        Box::new(DiscordDispatcher),
-    );
+    registry.register(is_discord_webhook, Box::new(DiscordDispatcher));
     // Generic dispatcher as fallback.
     registry.register(|_url| true, Box::new(GenericDispatcher));
     registry
 }
 
+/// The default registry, built once and shared by every notification.
+static DEFAULT_REGISTRY: LazyLock<DispatcherRegistry> = LazyLock::new(default_registry);
+
 /// Sends a notification to the given webhook URL.
 ///
 /// It converts any extra data into a JSON value and selects the appropriate dispatcher
@@ -249,12 +248,11 @@ pub fn send_notification<T: Serialize>(
     data: Option<T>,
 ) -> Result<(), NotificationError> {
     validate_webhook_url(webhook_url)?;
-    let registry = default_registry();
     let data_value = match data {
         Some(d) => Some(serde_json::to_value(d)?),
         None => None,
     };
-    if let Some((_, dispatcher)) = registry.get_dispatcher(webhook_url) {
+    if let Some((_, dispatcher)) = DEFAULT_REGISTRY.get_dispatcher(webhook_url) {
         dispatcher.send_payload(webhook_url, notification_type, message, data_value)
     } else {
         Err(NotificationError::DispatcherNotFound(
@@ -1,7 +1,12 @@
 use crate::{NotificationError, send_notification};
 use gsm_shared::fetch_var;
-use tracing::debug;
+use std::io;
+use std::sync::mpsc::{self, SendError, Sender};
+use std::sync::{LazyLock, Mutex, PoisonError};
+use std::thread::{self, JoinHandle};
+use tracing::{debug, warn};
 
+#[derive(Debug, PartialEq, Eq)]
 pub enum StandardServerEvents {
     PlayerJoined(String),
     PlayerLeft(String),
@@ -28,12 +33,12 @@ pub enum StandardServerEvents {
 /// Returns any notification dispatch error produced by URL validation, serialization,
 /// transport, or webhook response status checks.
 pub fn send_notifications(event: StandardServerEvents) -> Result<(), NotificationError> {
-    let server_name = fetch_var("NAME", "My Server");
     let webhook_url = fetch_var("WEBHOOK_URL", "");
     if webhook_url.is_empty() {
         debug!("Skipping notification, WEBHOOK_URL is not present.");
         return Ok(());
     }
+    let server_name = fetch_var("NAME", "My Server");
     match event {
         StandardServerEvents::PlayerJoined(name) => send_notification::<Option<String>>(
             &webhook_url,
@@ -68,6 +73,93 @@ pub fn send_notifications(event: StandardServerEvents) -> Result<(), Notificatio
     }
 }
 
+/// Background thread that delivers queued events in the order they were queued.
+struct NotificationWorker {
+    sender: Sender<StandardServerEvents>,
+    handle: JoinHandle<()>,
+}
+
+impl NotificationWorker {
+    /// Spawns the worker thread, which hands each queued event to `deliver`.
+    fn spawn(deliver: impl Fn(StandardServerEvents) + Send + 'static) -> io::Result<Self> {
+        let (sender, receiver) = mpsc::channel::<StandardServerEvents>();
+        let handle = thread::Builder::new()
+            .name("gsm-notifications".to_owned())
+            .spawn(move || {
+                for event in receiver {
+                    deliver(event);
+                }
+            })?;
+        Ok(Self { sender, handle })
+    }
+
+    /// Queues an event, handing it back if the worker thread has gone away.
+    fn queue(&self, event: StandardServerEvents) -> Result<(), StandardServerEvents> {
+        self.sender.send(event).map_err(|SendError(event)| event)
+    }
+
+    /// Waits until every queued event has been delivered, then stops the thread.
+    fn finish(self) {
+        drop(self.sender);
+        if self.handle.join().is_err() {
+            warn!("Notification worker panicked before delivering every queued event.");
+        }
+    }
+}
+
+/// Sends an event on the calling thread, logging any delivery error.
+fn deliver_notification(event: StandardServerEvents) {
+    if let Err(e) = send_notifications(event) {
+        warn!("Failed to send webhook notification: {e}");
+    }
+}
+
+/// Worker used by `queue_notification`.
+///
+/// `None` when the thread could not be spawned or `flush_notifications` has run.
+static NOTIFICATION_WORKER: LazyLock<Mutex<Option<NotificationWorker>>> = LazyLock::new(|| {
+    let worker = NotificationWorker::spawn(deliver_notification)
+        .map_err(|e| warn!("Failed to spawn notification worker: {e}"))
+        .ok();
+    Mutex::new(worker)
+});
+
+/// Queues a notification for the server event without waiting for it to be sent.
+///
+/// Meant for callers such as log monitor rules, which should keep reading while the
+/// webhook request is in flight. Notifications are delivered in order on a background
+/// thread and delivery errors are logged. If that thread is unavailable, or
+/// `flush_notifications` has already run, the notification is sent on the calling
+/// thread instead.
+pub fn queue_notification(event: StandardServerEvents) {
+    let queued = {
+        let worker = NOTIFICATION_WORKER
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        match worker.as_ref() {
+            Some(worker) => worker.queue(event),
+            None => Err(event),
+        }
+    };
+    if let Err(event) = queued {
+        deliver_notification(event);
+    }
+}
+
+/// Delivers every notification queued by `queue_notification` before returning.
+///
+/// Call this before the process exits, otherwise queued notifications are lost with
+/// the worker thread. Notifications queued afterwards are sent synchronously.
+pub fn flush_notifications() {
+    let worker = NOTIFICATION_WORKER
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .take();
+    if let Some(worker) = worker {
+        worker.finish();
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -104,4 +196,35 @@ mod tests {
 
         unsafe { std::env::remove_var("WEBHOOK_URL") };
     }
+
+    #[test]
+    fn worker_delivers_queued_events_in_order_before_finishing() {
+        let (delivered_tx, delivered_rx) = mpsc::channel();
+        let worker = NotificationWorker::spawn(move |event| {
+            delivered_tx
+                .send(event)
+                .unwrap_or_else(|_| panic!("test receiver dropped"));
+        })
+        .unwrap_or_else(|e| panic!("failed to spawn worker: {e}"));
+
+        for event in [
+            StandardServerEvents::Started,
+            StandardServerEvents::PlayerJoined("Alice".to_owned()),
+            StandardServerEvents::PlayerLeft("Alice".to_owned()),
+        ] {
+            assert!(worker.queue(event).is_ok());
+        }
+        worker.finish();
+
+        // finish() joined the worker, so every event is already in the channel.
+        let delivered: Vec<_> = delivered_rx.try_iter().collect();
+        assert_eq!(
+            delivered,
+            [
+                StandardServerEvents::Started,
+                StandardServerEvents::PlayerJoined("Alice".to_owned()),
+                StandardServerEvents::PlayerLeft("Alice".to_owned()),
+            ]
+        );
+    }
 }
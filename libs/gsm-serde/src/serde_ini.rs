@@ -25,35 +25,52 @@ pub trait IniHeader {
     fn ini_header() -> &'static str;
 }
 
-/// Helper: Format a serde_json number with up to 5 decimal places, trimming trailing zeros.
-fn format_number(n: &serde_json::Number) -> String {
-    n.as_f64().map_or_else(
-        || n.to_string(),
-        |f| {
-            // Format to 5 decimals.
-            let s = format!("{f:.5}");
-            // Trim trailing zeros and possible trailing dot.
-            let s = s.trim_end_matches('0').trim_end_matches('.');
-            if s.is_empty() {
-                "0".to_owned()
-            } else {
-                s.to_owned()
-            }
-        },
-    )
+/// Helper: Append a serde_json number with up to 5 decimal places, trimming trailing zeros.
+fn write_number(output: &mut String, n: &serde_json::Number) {
+    let Some(f) = n.as_f64() else {
+        let _ = write!(output, "{n}");
+        return;
+    };
+    let start = output.len();
+    // Format to 5 decimals.
+    let _ = write!(output, "{f:.5}");
+    // Trim trailing zeros and possible trailing dot in place.
+    let trimmed_len = output
+        .get(start..)
+        .map_or(0, |s| s.trim_end_matches('0').trim_end_matches('.').len());
+    output.truncate(start + trimmed_len);
+    if trimmed_len == 0 {
+        output.push('0');
+    }
 }
 
-/// Helper: Format a JSON value appropriately.
-fn format_json_value(value: &serde_json::Value) -> String {
+/// Helper: Append a JSON value formatted appropriately.
+fn write_json_value(output: &mut String, value: &serde_json::Value) {
     match value {
-        serde_json::Value::String(s) => format!("\"{s}\""),
-        serde_json::Value::Bool(b) => b.to_string(),
-        serde_json::Value::Number(n) => format_number(n),
-        _ => format!("{value}"),
+        serde_json::Value::String(s) => {
+            output.push('"');
+            output.push_str(s);
+            output.push('"');
+        }
+        serde_json::Value::Bool(b) => output.push_str(if *b { "true" } else { "false" }),
+        serde_json::Value::Number(n) => write_number(output, n),
+        _ => {
+            let _ = write!(output, "{value}");
+        }
     }
 }
 
-/// Serializes a JSON object into INI body text.
+/// Helper: Append `indent` tab characters unless in compact mode.
+fn write_indent(output: &mut String, indent: usize, compact: bool) {
+    if !compact {
+        output.extend(std::iter::repeat_n('\t', indent));
+    }
+}
+
+/// Serializes a JSON object into INI body text, appending to `output`.
+///
+/// Everything is written into the one caller-owned buffer, so nested blocks and
+/// individual values do not allocate strings of their own.
 ///
 /// In `compact` mode, entries are joined on a single line with commas and no
 /// trailing comma after the last entry in each object — some game engines
@@ -61,9 +78,7 @@ fn format_json_value(value: &serde_json::Value) -> String {
 /// `OptionSettings=(...)` block and require it on one line. Non-compact mode
 /// keeps the original indented, one-entry-per-line, trailing-comma format
 /// intended for human-readable display.
-fn serialize_value(value: &serde_json::Value, indent: usize, compact: bool) -> String {
-    let mut output = String::new();
-    let indent_str = if compact { String::new() } else { "\t".repeat(indent) };
+fn write_value(output: &mut String, value: &serde_json::Value, indent: usize, compact: bool) {
     if let serde_json::Value::Object(map) = value {
         // Collect and sort keys alphabetically.
         let mut entries: Vec<_> = map.iter().collect();
@@ -71,7 +86,7 @@ fn serialize_value(value: &serde_json::Value, indent: usize, compact: bool) -> S
         let entry_count = entries.len();
         for (i, (key, val)) in entries.into_iter().enumerate() {
             let is_last = i + 1 == entry_count;
-            output.push_str(&indent_str);
+            write_indent(output, indent, compact);
             output.push_str(key);
             output.push('=');
             if let serde_json::Value::Object(_) = val {
@@ -80,8 +95,8 @@ fn serialize_value(value: &serde_json::Value, indent: usize, compact: bool) -> S
                 if !compact {
                     output.push('\n');
                 }
-                output.push_str(&serialize_value(val, indent + 1, compact));
-                output.push_str(&indent_str);
+                write_value(output, val, indent + 1, compact);
+                write_indent(output, indent, compact);
                 output.push(')');
                 if !compact {
                     output.push('\n');
@@ -89,7 +104,7 @@ fn serialize_value(value: &serde_json::Value, indent: usize, compact: bool) -> S
                     output.push(',');
                 }
             } else {
-                output.push_str(&format_json_value(val));
+                write_json_value(output, val);
                 if !compact || !is_last {
                     output.push(',');
                 }
@@ -99,10 +114,9 @@ fn serialize_value(value: &serde_json::Value, indent: usize, compact: bool) -> S
             }
         }
     } else {
-        output.push_str(&indent_str);
-        output.push_str(&format_json_value(value));
+        write_indent(output, indent, compact);
+        write_json_value(output, value);
     }
-    output
 }
 
 /// Serializes a struct into an INI-formatted string.
@@ -203,17 +217,16 @@ pub fn to_string<T: Serialize + IniHeader>(value: &T) -> Result<String, serde_js
         let mut entries: Vec<(String, serde_json::Value)> = map.into_iter().collect();
         entries.sort_by(|(a, _), (b, _)| a.cmp(b));
         for (key, val) in entries {
-            match val {
-                serde_json::Value::Object(_) => {
-                    // For nested objects, use the recursive helper with indent level 1.
-                    output.push_str(&key);
-                    output.push_str("=(\n");
-                    output.push_str(&serialize_value(&val, 1, false));
-                    output.push_str(")\n");
-                }
-                _ => {
-                    let _ = writeln!(output, "{key}={},", format_json_value(&val));
-                }
+            output.push_str(&key);
+            if val.is_object() {
+                // For nested objects, use the recursive helper with indent level 1.
+                output.push_str("=(\n");
+                write_value(&mut output, &val, 1, false);
+                output.push_str(")\n");
+            } else {
+                output.push('=');
+                write_json_value(&mut output, &val);
+                output.push_str(",\n");
             }
         }
     }
@@ -247,25 +260,19 @@ pub fn to_string_compact<T: Serialize + IniHeader>(value: &T) -> Result<String,
         let entry_count = entries.len();
         for (i, (key, val)) in entries.into_iter().enumerate() {
             let is_last = i + 1 == entry_count;
-            match val {
-                serde_json::Value::Object(_) => {
-                    output.push_str(&key);
-                    output.push_str("=(");
-                    output.push_str(&serialize_value(&val, 0, true));
-                    output.push(')');
-                    if !is_last {
-                        output.push(',');
-                    }
-                    output.push('\n');
-                }
-                _ => {
-                    let _ = write!(output, "{key}={}", format_json_value(&val));
-                    if !is_last {
-                        output.push(',');
-                    }
-                    output.push('\n');
-                }
+            output.push_str(&key);
+            output.push('=');
+            if val.is_object() {
+                output.push('(');
+                write_value(&mut output, &val, 0, true);
+                output.push(')');
+            } else {
+                write_json_value(&mut output, &val);
+            }
+            if !is_last {
+                output.push(',');
             }
+            output.push('\n');
         }
     }
 
@@ -436,6 +443,21 @@ mod tests {
         option_settings: OptionSettings,
     }
 
+    #[test]
+    fn write_json_value_appends_formatted_values() {
+        let mut output = String::from("x=");
+        write_json_value(&mut output, &serde_json::json!(1.5));
+        output.push(',');
+        write_json_value(&mut output, &serde_json::json!(0.0));
+        output.push(',');
+        write_json_value(&mut output, &serde_json::json!(100));
+        output.push(',');
+        write_json_value(&mut output, &serde_json::json!("text"));
+        output.push(',');
+        write_json_value(&mut output, &serde_json::json!(true));
+        assert_eq!(output, "x=1.5,0,100,\"text\",true");
+    }
+
     #[test]
     fn test_ini_serialization_with_nested_struct() {
         let settings = GameSettings {
@@ -1,6 +1,7 @@
 use crate::parse_truthy;
-use cached::macros::cached;
+use std::collections::HashMap;
 use std::env;
+use std::sync::{LazyLock, Mutex, PoisonError};
 
 /// Strips a single matching pair of wrapping double or single quotes, if present.
 ///
@@ -43,11 +44,16 @@ pub fn fetch_multiple_var(name: &str, default: &str) -> String {
     }
 }
 
+/// Results of [`is_env_var_truthy`], keyed by variable name.
+static TRUTHY_CACHE: LazyLock<Mutex<HashMap<&'static str, bool>>> = LazyLock::new(Mutex::default);
+
 /// Determines if the named environment variable is truthy.
 /// Uses caching for improved performance.
-#[cached]
 pub fn is_env_var_truthy(name: &'static str) -> bool {
-    parse_truthy(&fetch_var(name, "0")).unwrap_or(false)
+    let mut cache = TRUTHY_CACHE.lock().unwrap_or_else(PoisonError::into_inner);
+    *cache
+        .entry(name)
+        .or_insert_with(|| parse_truthy(&fetch_var(name, "0")).unwrap_or(false))
 }
 
 #[cfg(test)]
@@ -168,6 +174,23 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_is_env_var_truthy_is_cached() {
+        let key = "TEST_IS_ENV_VAR_TRUTHY_IS_CACHED";
+        unsafe {
+            env::set_var(key, "true");
+        }
+        assert!(is_env_var_truthy(key));
+        unsafe {
+            env::set_var(key, "false");
+        }
+        // The first answer is kept for the life of the process.
+        assert!(is_env_var_truthy(key));
+        unsafe {
+            env::remove_var(key);
+        }
+    }
+
     #[test]
     fn test_is_env_var_truthy_falsy() {
         let key = "TEST_IS_ENV_VAR_TRUTHY_FALSY";
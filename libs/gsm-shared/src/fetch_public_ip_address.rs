@@ -1,8 +1,14 @@
 use reqwest::blocking::Client;
 use std::env::VarError;
+use std::sync::{LazyLock, mpsc};
+use std::thread;
 use std::{env, fmt};
 use tracing::{debug, error};
 
+/// HTTP client shared by every public IP lookup, so repeated lookups reuse pooled
+/// connections. It (and its TLS backend) is only built once a lookup needs it.
+static HTTP_CLIENT: LazyLock<Client> = LazyLock::new(Client::new);
+
 #[derive(Debug, serde::Deserialize, serde::Serialize)]
 struct IPResponse {
     ip: String,
@@ -61,6 +67,9 @@ impl IPConfig {
 
     /// Fetches the public IP from known API endpoints.
     ///
+    /// All endpoints are queried at once and the first parseable answer wins, so
+    /// a slow or unreachable service no longer delays the ones after it.
+    ///
     /// # Errors
     ///
     /// Returns an error when all configured endpoints fail to return a parseable
@@ -72,30 +81,46 @@ impl IPConfig {
             "https://ipinfo.io",
         ];
 
+        let (sender, receiver) = mpsc::channel();
         for url in urls {
-            match client.get(url).send() {
-                Ok(response) => match response.json::<IPResponse>() {
-                    Ok(json) => return Ok(json.ip),
-                    Err(e) => {
-                        debug!("Failed to parse JSON from {}: {}", url, e);
-                    }
-                },
-                Err(e) => {
-                    debug!("Request to {} failed: {}", url, e);
-                }
+            let client = client.clone();
+            let sender = sender.clone();
+            let lookup = move || {
+                let _ = sender.send(fetch_ip(&client, url));
+            };
+            // The client is shared, so each worker reuses its connection pool.
+            if let Err(e) = thread::Builder::new().spawn(lookup.clone()) {
+                debug!("Failed to spawn IP lookup for {}: {}", url, e);
+                lookup();
             }
         }
+        drop(sender);
 
-        Err(Box::new(std::io::Error::new(
-            std::io::ErrorKind::NotFound,
-            "All IP fetch attempts failed",
-        )))
+        receiver.iter().flatten().next().ok_or_else(|| {
+            std::io::Error::new(std::io::ErrorKind::NotFound, "All IP fetch attempts failed").into()
+        })
+    }
+}
+
+/// Queries a single IP lookup endpoint, logging and discarding any failure.
+fn fetch_ip(client: &Client, url: &str) -> Option<String> {
+    match client.get(url).send() {
+        Ok(response) => match response.json::<IPResponse>() {
+            Ok(json) => Some(json.ip),
+            Err(e) => {
+                debug!("Failed to parse JSON from {}: {}", url, e);
+                None
+            }
+        },
+        Err(e) => {
+            debug!("Request to {} failed: {}", url, e);
+            None
+        }
     }
 }
 
 // Standardized way of fetching public address.
 pub fn fetch_public_address() -> IPConfig {
-    let client = Client::new();
     let mut ip_config = IPConfig::default();
     debug!("Checking for address in env");
     match ip_config.to_string_from_env() {
@@ -103,7 +128,7 @@ pub fn fetch_public_address() -> IPConfig {
             debug!("Fetched IP from env: {}", ip);
             ip
         }
-        Err(_) => match ip_config.fetch_ip_from_api(&client) {
+        Err(_) => match ip_config.fetch_ip_from_api(&HTTP_CLIENT) {
             Ok(ip) => {
                 debug!("Fetched IP from API: {}", ip);
                 ip_config.ip = ip;
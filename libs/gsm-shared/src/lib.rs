@@ -18,6 +18,9 @@ pub use parse_truthy::*;
 mod environment;
 pub use environment::*;
 
+mod write_atomic;
+pub use write_atomic::*;
+
 mod constants;
 
 pub fn get_working_dir() -> String {
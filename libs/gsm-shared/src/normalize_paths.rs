@@ -1,6 +1,5 @@
 use std::fs;
 use std::path::{Path, PathBuf};
-use tempfile::tempdir;
 use walkdir::WalkDir;
 
 /// Replaces backslashes with forward slashes in the string representation of a path.
@@ -21,81 +20,56 @@ fn validate_source_dir(src_dir: &Path) -> std::io::Result<()> {
     }
 }
 
-/// Moves and normalizes contents from the source directory into the temporary directory.
-/// Each file or subdirectory is moved to a new location whose relative path is normalized.
-fn move_and_normalize_to_temp(src_dir: &Path, temp_root: &Path) -> std::io::Result<()> {
-    for entry in WalkDir::new(src_dir).into_iter().filter_map(Result::ok) {
-        let src_path = entry.path();
-        // Compute the relative path to src_dir.
-        let relative_path = src_path
+/// Normalizes paths in `src_dir` by rewriting each relative path that contains a
+/// backslash to use forward slashes.
+///
+/// Only entries whose relative path actually contains a backslash are moved;
+/// everything else is left where it is.
+///
+/// # Errors
+///
+/// Returns an error if any file system operation fails.
+pub fn normalize_paths(src_dir: &Path) -> std::io::Result<()> {
+    // Ensure the source directory exists.
+    validate_source_dir(src_dir)?;
+
+    // Collect the affected entries before touching anything so the walk is not
+    // disturbed by the renames. Contents come before their directory, so a
+    // directory is empty by the time it is removed.
+    let mut entries = Vec::new();
+    for entry in WalkDir::new(src_dir)
+        .contents_first(true)
+        .into_iter()
+        .filter_map(Result::ok)
+    {
+        let relative_path = entry
+            .path()
             .strip_prefix(src_dir)
             .map_err(std::io::Error::other)?;
-        // Normalize the relative path by replacing backslashes with forward slashes.
-        let normalized_relative_path = normalize_path(relative_path);
-        let temp_dest_path = temp_root.join(&normalized_relative_path);
-
-        if src_path.is_dir() {
-            fs::create_dir_all(&temp_dest_path)?;
-        } else {
-            if let Some(parent) = temp_dest_path.parent() {
-                fs::create_dir_all(parent)?;
-            }
-            fs::rename(src_path, &temp_dest_path)?;
+        if relative_path.to_string_lossy().contains('\\') {
+            let normalized_path = src_dir.join(normalize_path(relative_path));
+            entries.push((
+                entry.path().to_path_buf(),
+                normalized_path,
+                entry.file_type(),
+            ));
         }
     }
-    Ok(())
-}
-
-/// Moves normalized contents from the temporary directory back into the source directory.
-fn move_normalized_back(temp_root: &Path, src_dir: &Path) -> std::io::Result<()> {
-    for entry in WalkDir::new(temp_root).into_iter().filter_map(Result::ok) {
-        let entry_path = entry.path();
-        let relative_path = entry_path
-            .strip_prefix(temp_root)
-            .map_err(std::io::Error::other)?;
-        let original_dest_path = src_dir.join(relative_path);
 
-        if entry_path.is_dir() {
-            fs::create_dir_all(&original_dest_path)?;
+    for (src_path, normalized_path, file_type) in entries {
+        if file_type.is_dir() {
+            fs::create_dir_all(&normalized_path)?;
+            fs::remove_dir(&src_path)?;
         } else {
-            if let Some(parent) = original_dest_path.parent() {
+            if let Some(parent) = normalized_path.parent() {
                 fs::create_dir_all(parent)?;
             }
-            fs::rename(entry_path, &original_dest_path)?;
+            fs::rename(&src_path, &normalized_path)?;
         }
     }
     Ok(())
 }
 
-/// Normalizes paths in `src_dir` by moving its contents to a temporary location,
-/// rewriting each relative path to use forward slashes, and moving the normalized
-/// contents back into a fresh `src_dir`.
-///
-/// # Errors
-///
-/// Returns an error if any file system operation fails.
-pub fn normalize_paths(src_dir: &Path) -> std::io::Result<()> {
-    // Ensure the source directory exists.
-    validate_source_dir(src_dir)?;
-
-    // Create a temporary directory.
-    let temp_dir = tempdir()?;
-    let temp_root = temp_dir.path();
-
-    // Move and normalize contents from src_dir to the temporary directory.
-    move_and_normalize_to_temp(src_dir, temp_root)?;
-
-    // Remove the original directory and recreate it empty.
-    fs::remove_dir_all(src_dir)?;
-    fs::create_dir_all(src_dir)?;
-
-    // Move the normalized contents back into the source directory.
-    move_normalized_back(temp_root, src_dir)?;
-
-    // temp_dir is automatically deleted when it goes out of scope.
-    Ok(())
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -151,6 +125,24 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn test_normalize_paths_leaves_plain_paths_in_place() -> std::io::Result<()> {
+        let temp_dir = tempdir()?;
+        let src_dir = setup_test_dir(temp_dir.path())?;
+        fs::create_dir_all(src_dir.join("plugins"))?;
+        fs::write(src_dir.join("plugins").join("mod.dll"), "dll")?;
+
+        normalize_paths(&src_dir)?;
+
+        assert_no_backslashes(&src_dir);
+        assert!(!src_dir.join("foo\\bar").exists());
+        assert_eq!(
+            fs::read_to_string(src_dir.join("plugins").join("mod.dll"))?,
+            "dll"
+        );
+        Ok(())
+    }
+
     #[test]
     fn test_normalize_paths_errors_on_nonexistent_dir() {
         let non_existent = PathBuf::from("this_directory_should_not_exist");
@@ -0,0 +1,69 @@
+use std::fs;
+use std::io::Write;
+use std::path::Path;
+use tempfile::Builder;
+
+/// Writes `contents` to `path` by writing a temporary file in the same directory
+/// and renaming it over the destination.
+///
+/// Readers never observe a truncated or half-written file: they see either the
+/// previous contents or the new ones. An existing destination keeps its
+/// permissions; a new one gets the same mode `fs::write` would have given it.
+///
+/// # Errors
+///
+/// Returns an error if the temporary file cannot be created, written, or
+/// renamed into place.
+pub fn write_atomic<P: AsRef<Path>, C: AsRef<[u8]>>(path: P, contents: C) -> std::io::Result<()> {
+    let path = path.as_ref();
+    let dir = path
+        .parent()
+        .filter(|parent| !parent.as_os_str().is_empty())
+        .unwrap_or_else(|| Path::new("."));
+
+    let mut builder = Builder::new();
+    #[cfg(unix)]
+    {
+        use std::os::unix::fs::PermissionsExt;
+        builder.permissions(fs::Permissions::from_mode(0o666));
+    }
+
+    let mut file = builder.tempfile_in(dir)?;
+    file.write_all(contents.as_ref())?;
+    if let Ok(metadata) = fs::metadata(path) {
+        file.as_file().set_permissions(metadata.permissions())?;
+    }
+    file.as_file().sync_all()?;
+    file.persist(path).map_err(|err| err.error)?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::tempdir;
+
+    #[test]
+    fn test_write_atomic_creates_and_replaces_file() -> std::io::Result<()> {
+        let temp_dir = tempdir()?;
+        let path = temp_dir.path().join("config.json");
+
+        write_atomic(&path, "first")?;
+        assert_eq!(fs::read_to_string(&path)?, "first");
+
+        write_atomic(&path, "second")?;
+        assert_eq!(fs::read_to_string(&path)?, "second");
+
+        // Only the destination remains; the temporary file was renamed over it.
+        assert_eq!(fs::read_dir(temp_dir.path())?.count(), 1);
+        Ok(())
+    }
+
+    #[test]
+    fn test_write_atomic_errors_when_directory_is_missing() -> std::io::Result<()> {
+        let temp_dir = tempdir()?;
+        let path = temp_dir.path().join("missing").join("config.json");
+        assert!(write_atomic(path, "data").is_err());
+        Ok(())
+    }
+}
@@ -4,7 +4,11 @@ use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::error::Error;
 use std::fs;
+use std::io::{BufWriter, Write};
+use std::num::NonZeroUsize;
 use std::path::{Path, PathBuf};
+use std::sync::LazyLock;
+use std::thread;
 
 #[derive(Parser, Debug)]
 #[clap(about = "Scans Rust projects for environment variables")]
@@ -17,7 +21,7 @@ struct Cli {
     output: Option<PathBuf>,
 }
 
-#[derive(Serialize, Deserialize, Debug, Default)]
+#[derive(Serialize, Deserialize, Debug, Default, Clone)]
 struct EnvVarInfo {
     field: Option<String>,
     var_type: Option<String>,
@@ -27,46 +31,140 @@ struct EnvVarInfo {
 
 fn main() -> Result<(), Box<dyn Error>> {
     let args = Cli::parse();
-    let cargo_files = find_cargo_toml_files(&args.directory)?;
-    println!("Found {} Cargo.toml files", cargo_files.len());
+    let scan = scan_directory(Path::new(&args.directory))?;
+    println!("Found {} Cargo.toml files", scan.cargo_files.len());
 
-    for cargo_file in cargo_files {
-        process_cargo_toml(&cargo_file, args.output.as_deref())?;
+    let sources = extract_sources(&scan.rust_files)?;
+
+    for cargo_file in &scan.cargo_files {
+        process_cargo_toml(cargo_file, &sources, args.output.as_deref())?;
     }
 
     println!("Processing complete!");
     Ok(())
 }
 
-fn find_cargo_toml_files(dir: &str) -> Result<Vec<PathBuf>, Box<dyn Error>> {
-    let mut result = Vec::new();
+/// Every `Cargo.toml` and `.rs` file found beneath the scan root.
+#[derive(Debug, Default)]
+struct ScanResult {
+    cargo_files: Vec<PathBuf>,
+    rust_files: Vec<PathBuf>,
+}
+
+/// Walks `dir` once, collecting manifests and Rust sources in the same pass so
+/// that each crate does not need to re-walk its own subtree.
+fn scan_directory(dir: &Path) -> Result<ScanResult, Box<dyn Error>> {
+    let mut result = ScanResult::default();
+    scan_into(dir, &mut result)?;
+    Ok(result)
+}
+
+fn scan_into(dir: &Path, result: &mut ScanResult) -> Result<(), Box<dyn Error>> {
     for entry in fs::read_dir(dir)? {
-        let path = entry?.path();
-        if path.is_dir() {
-            result.extend(find_cargo_toml_files(path.to_string_lossy().as_ref())?);
+        let entry = entry?;
+        let path = entry.path();
+        // The entry's file type comes from the directory listing itself; only
+        // symlinks need an extra stat to learn what they point at.
+        let file_type = entry.file_type()?;
+        if file_type.is_dir() || (file_type.is_symlink() && path.is_dir()) {
+            scan_into(&path, result)?;
         } else if path.file_name().is_some_and(|f| f == "Cargo.toml") {
-            result.push(path);
+            result.cargo_files.push(path);
+        } else if path.extension().is_some_and(|e| e == "rs") {
+            result.rust_files.push(path);
         }
     }
-    Ok(result)
+    Ok(())
+}
+
+/// The environment variables referenced by a single Rust source file.
+#[derive(Debug)]
+struct SourceEnvVars {
+    path: PathBuf,
+    env_vars: HashMap<String, EnvVarInfo>,
+}
+
+/// Extracts the variables of every source file exactly once, even when the file
+/// belongs to several nested crates.
+///
+/// Matching is CPU bound, so the files are split into contiguous chunks that are
+/// scanned on one worker thread per available core. Results are collected back in
+/// the original file order.
+fn extract_sources(rust_files: &[PathBuf]) -> Result<Vec<SourceEnvVars>, Box<dyn Error>> {
+    let workers = thread::available_parallelism().map_or(1, NonZeroUsize::get);
+    let chunk_size = rust_files.len().div_ceil(workers).max(1);
+
+    thread::scope(|scope| {
+        let handles: Vec<_> = rust_files
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || extract_chunk(chunk)))
+            .collect();
+
+        let mut sources = Vec::with_capacity(rust_files.len());
+        for handle in handles {
+            let chunk = handle
+                .join()
+                .map_err(|_| "env var extraction worker panicked")??;
+            sources.extend(chunk);
+        }
+        Ok(sources)
+    })
+}
+
+fn extract_chunk(rust_files: &[PathBuf]) -> Result<Vec<SourceEnvVars>, String> {
+    rust_files
+        .iter()
+        .map(|path| {
+            let mut env_vars = HashMap::new();
+            extract_env_vars_from_file(path, &mut env_vars)
+                .map_err(|e| format!("{}: {e}", path.display()))?;
+            Ok(SourceEnvVars {
+                path: path.clone(),
+                env_vars,
+            })
+        })
+        .collect()
 }
 
-fn process_cargo_toml(cargo_path: &Path, output_path: Option<&Path>) -> Result<(), Box<dyn Error>> {
+/// Folds `source` into `target`, letting later files fill in or override the
+/// details captured for a variable, exactly as scanning them in order would.
+fn merge_env_vars(target: &mut HashMap<String, EnvVarInfo>, source: &HashMap<String, EnvVarInfo>) {
+    for (name, info) in source {
+        let entry = target.entry(name.clone()).or_default();
+        if info.field.is_some() {
+            entry.field.clone_from(&info.field);
+        }
+        if info.var_type.is_some() {
+            entry.var_type.clone_from(&info.var_type);
+        }
+        if info.default.is_some() {
+            entry.default.clone_from(&info.default);
+        }
+    }
+}
+
+fn process_cargo_toml(
+    cargo_path: &Path,
+    sources: &[SourceEnvVars],
+    output_path: Option<&Path>,
+) -> Result<(), Box<dyn Error>> {
     println!("Processing: {}", cargo_path.display());
     let project_dir = cargo_path.parent().ok_or("Missing parent directory")?;
-    let rust_files = find_rust_files(project_dir)?;
     let mut env_vars: HashMap<String, EnvVarInfo> = HashMap::new();
 
-    for file in rust_files {
-        extract_env_vars_from_file(&file, &mut env_vars)?;
+    for source in sources.iter().filter(|s| s.path.starts_with(project_dir)) {
+        merge_env_vars(&mut env_vars, &source.env_vars);
     }
 
     let out_path = output_path.map_or_else(
         || project_dir.join("variables.json"),
         std::path::Path::to_path_buf,
     );
-    let json = serde_json::to_string_pretty(&env_vars)?;
-    fs::write(&out_path, json)?;
+    // Serialize straight into a buffered file instead of rendering the whole
+    // document into a string first.
+    let mut writer = BufWriter::new(fs::File::create(&out_path)?);
+    serde_json::to_writer_pretty(&mut writer, &env_vars)?;
+    writer.flush()?;
     println!(
         "Wrote {} variables to {}",
         env_vars.len(),
@@ -75,108 +173,129 @@ fn process_cargo_toml(cargo_path: &Path, output_path: Option<&Path>) -> Result<(
     Ok(())
 }
 
-fn find_rust_files(dir: &Path) -> Result<Vec<PathBuf>, Box<dyn Error>> {
-    let mut rust_files = Vec::new();
-    for entry in fs::read_dir(dir)? {
-        let path = entry?.path();
-        if path.is_dir() {
-            rust_files.extend(find_rust_files(&path)?);
-        } else if path.extension().is_some_and(|e| e == "rs") {
-            rust_files.push(path);
-        }
-    }
-    Ok(rust_files)
+/// How a pattern's default value capture (group 2) is recorded.
+#[derive(Clone, Copy)]
+enum DefaultCapture {
+    Raw,
+    Trimmed,
 }
 
-fn extract_env_vars_from_file(
-    file_path: &Path,
-    env_vars: &mut HashMap<String, EnvVarInfo>,
-) -> Result<(), Box<dyn Error>> {
-    let content = fs::read_to_string(file_path)?;
+/// A source pattern that reads an environment variable. Group 1 is always the
+/// variable name.
+struct EnvPattern {
+    regex: Regex,
+    field_group: Option<usize>,
+    type_group: Option<usize>,
+    default: Option<DefaultCapture>,
+    is_bool: bool,
+}
 
-    // Each pattern is now in a raw string literal (r#"..."#),
-    // which avoids having to escape backslashes multiple times.
-    // We also allow multiline with (?s) and an optional trailing comma with (?:,)?
-    let patterns = vec![
+/// The patterns are compiled once and shared by every file and worker thread.
+///
+/// Each pattern is in a raw string literal (r#"..."#), which avoids having to
+/// escape backslashes multiple times. We also allow multiline with (?s) and an
+/// optional trailing comma with (?:,)?
+#[allow(clippy::expect_used)]
+static ENV_PATTERNS: LazyLock<Vec<EnvPattern>> = LazyLock::new(|| {
+    [
         (
             r#"(?s)std::env::var\("([A-Z0-9_]+)"\)(?:,)?"#,
-            Some((1, None, None)),
             None,
+            None,
+            None,
+            false,
         ),
         (
             r#"(?s)env::var\("([A-Z0-9_]+)"\)(?:,)?"#,
-            Some((1, None, None)),
             None,
+            None,
+            None,
+            false,
         ),
         (
             r#"(?s)env::var\("([A-Z0-9_]+)"\)\.unwrap_or_else\(\|[_a-zA-Z]*\|\s*settings\.([a-zA-Z0-9_]+)\.clone\(\)\)(?:,)?"#,
-            Some((1, Some(2), None)),
+            Some(2),
+            None,
             None,
+            false,
         ),
         (
             // More flexible approach with optional whitespace after 'env_parse!' and optional trailing comma.
             r#"(?s)env_parse!\s*\(\s*\"([A-Z0-9_]+)\"\s*,\s*(.*?)\s*,\s*([a-zA-Z0-9_:<>]+)\s*\)(?:,)?"#,
-            Some((1, None, Some(3))),
             None,
+            Some(3),
+            Some(DefaultCapture::Trimmed),
+            false,
         ),
         (
             r#"(?s)std::env::var\("([A-Z0-9_]+)"\)\.unwrap_or_else\(\|[_a-zA-Z]*\|\s*"([^"]+)"\.to_string\(\)\)(?:,)?"#,
-            Some((1, None, None)),
             None,
+            None,
+            None,
+            false,
         ),
         (
             r#"(?s)fetch_var\("([A-Z0-9_]+)"(?:,\s*"([^"]*)")?\)(?:,)?"#,
-            Some((1, None, None)),
-            Some("fetch_var"),
+            None,
+            None,
+            Some(DefaultCapture::Raw),
+            false,
         ),
         (
             r#"(?s)is_env_var_truthy\("([A-Z0-9_]+)"\)(?:,)?"#,
-            Some((1, None, None)),
-            Some("bool"),
+            None,
+            None,
+            None,
+            true,
         ),
-    ];
+    ]
+    .into_iter()
+    .map(
+        |(pattern, field_group, type_group, default, is_bool)| EnvPattern {
+            regex: Regex::new(pattern).expect("env var pattern should compile"),
+            field_group,
+            type_group,
+            default,
+            is_bool,
+        },
+    )
+    .collect()
+});
 
-    for (pattern, groups, extra_type) in patterns {
-        let regex = Regex::new(pattern)?;
-        for caps in regex.captures_iter(&content) {
+fn extract_env_vars_from_file(
+    file_path: &Path,
+    env_vars: &mut HashMap<String, EnvVarInfo>,
+) -> Result<(), Box<dyn Error>> {
+    let content = fs::read_to_string(file_path)?;
+
+    for pattern in ENV_PATTERNS.iter() {
+        for caps in pattern.regex.captures_iter(&content) {
             let Some(var_name_cap) = caps.get(1) else {
                 continue;
             };
             let var_name = var_name_cap.as_str().to_owned();
-            let entry = env_vars.entry(var_name.clone()).or_default();
-
-            // groups => (0: entire match) (1: var_name) (field_idx, type_idx)
-            if let Some((_, field_idx, type_idx)) = groups {
-                // If we have an index for the field, fill it
-                if let Some(f_idx) = field_idx
-                    && let Some(field_cap) = caps.get(f_idx)
-                {
-                    entry.field = Some(field_cap.as_str().to_owned());
-                }
-                // If we have an index for the type, fill it
-                if let Some(t_idx) = type_idx
-                    && let Some(var_type_cap) = caps.get(t_idx)
-                {
-                    entry.var_type = Some(var_type_cap.as_str().to_owned());
-                }
-                // fetch_var default is group(2)
-                if pattern.contains("fetch_var")
-                    && let Some(default_cap) = caps.get(2)
-                {
-                    entry.default = Some(default_cap.as_str().to_owned());
-                }
-                // env_parse! default is group(2)
-                if pattern.contains("env_parse!")
-                    && let Some(default_cap) = caps.get(2)
-                {
-                    entry.default = Some(default_cap.as_str().trim().to_owned());
-                }
+            let entry = env_vars.entry(var_name).or_default();
+
+            // If we have an index for the field, fill it
+            if let Some(field_cap) = pattern.field_group.and_then(|idx| caps.get(idx)) {
+                entry.field = Some(field_cap.as_str().to_owned());
+            }
+            // If we have an index for the type, fill it
+            if let Some(var_type_cap) = pattern.type_group.and_then(|idx| caps.get(idx)) {
+                entry.var_type = Some(var_type_cap.as_str().to_owned());
+            }
+            // fetch_var and env_parse! defaults are group(2)
+            if let Some(default) = pattern.default
+                && let Some(default_cap) = caps.get(2)
+            {
+                entry.default = Some(match default {
+                    DefaultCapture::Raw => default_cap.as_str().to_owned(),
+                    DefaultCapture::Trimmed => default_cap.as_str().trim().to_owned(),
+                });
             }
 
             // If "bool", we set the var_type
-            if let Some(hardcoded_type) = extra_type
-                && hardcoded_type == "bool"
-            {
+            if pattern.is_bool {
                 entry.var_type = Some("bool".to_owned());
             }
         }
@@ -212,17 +331,20 @@ pub fn example() {
     }
 
     #[test]
-    fn find_cargo_toml_files_recurses_into_nested_projects() {
+    fn scan_directory_recurses_into_nested_projects() {
         let temp_dir = tempdir().unwrap();
         let root = temp_dir.path();
         fs::write(root.join("Cargo.toml"), "[package]\nname = \"root\"\n").unwrap();
 
         let nested = root.join("nested");
-        fs::create_dir_all(&nested).unwrap();
+        fs::create_dir_all(nested.join("src")).unwrap();
         fs::write(nested.join("Cargo.toml"), "[package]\nname = \"nested\"\n").unwrap();
+        fs::write(nested.join("src/lib.rs"), "").unwrap();
+        fs::write(nested.join("README.md"), "").unwrap();
 
-        let files = find_cargo_toml_files(root.to_str().unwrap()).unwrap();
-        assert_eq!(files.len(), 2);
+        let scan = scan_directory(root).unwrap();
+        assert_eq!(scan.cargo_files.len(), 2);
+        assert_eq!(scan.rust_files, vec![nested.join("src/lib.rs")]);
     }
 
     #[test]
@@ -256,6 +378,51 @@ pub fn example() {
         assert_eq!(truthy_env.var_type.as_deref(), Some("bool"));
     }
 
+    #[test]
+    fn extract_sources_preserves_file_order() {
+        let temp_dir = tempdir().unwrap();
+        let paths: Vec<PathBuf> = (0..8)
+            .map(|i| {
+                let path = temp_dir.path().join(format!("src{i}.rs"));
+                fs::write(&path, format!("std::env::var(\"VAR_{i}\");")).unwrap();
+                path
+            })
+            .collect();
+
+        let sources = extract_sources(&paths).unwrap();
+        let found: Vec<&PathBuf> = sources.iter().map(|source| &source.path).collect();
+        assert_eq!(found, paths.iter().collect::<Vec<_>>());
+        assert!(sources.get(3).unwrap().env_vars.contains_key("VAR_3"));
+    }
+
+    #[test]
+    fn merge_env_vars_keeps_earlier_details_unless_overridden() {
+        let mut target = HashMap::new();
+        target.insert(
+            "VAR".to_owned(),
+            EnvVarInfo {
+                field: Some("field".to_owned()),
+                default: Some("old".to_owned()),
+                ..EnvVarInfo::default()
+            },
+        );
+
+        let mut source = HashMap::new();
+        source.insert(
+            "VAR".to_owned(),
+            EnvVarInfo {
+                default: Some("new".to_owned()),
+                ..EnvVarInfo::default()
+            },
+        );
+        merge_env_vars(&mut target, &source);
+
+        let var = target.get("VAR").unwrap();
+        assert_eq!(var.field.as_deref(), Some("field"));
+        assert_eq!(var.default.as_deref(), Some("new"));
+        assert!(var.var_type.is_none());
+    }
+
     #[test]
     fn process_cargo_toml_writes_variables_json() {
         let temp_dir = tempdir().unwrap();
@@ -270,7 +437,9 @@ pub fn example() {
         write_sample_source(&src_dir.join("lib.rs"));
 
         let cargo_path = project_dir.join("Cargo.toml");
-        process_cargo_toml(&cargo_path, None).unwrap();
+        let scan = scan_directory(temp_dir.path()).unwrap();
+        let sources = extract_sources(&scan.rust_files).unwrap();
+        process_cargo_toml(&cargo_path, &sources, None).unwrap();
 
         let variables = fs::read_to_string(project_dir.join("variables.json")).unwrap();
         assert!(variables.contains("\"STD_ENV\""));